@@ -55,6 +55,36 @@ class Array(IArray[T]):
         for index in range(self.__logical_size):
             self.__elements[index] = copy.deepcopy(starting_sequence[index])
 
+    @staticmethod
+    def from_numpy(elements: NDArray, data_type: type=object) -> Array[T]:
+        """
+        Wrap an existing one-dimensional NumPy array without copying it.
+        
+        The new Array shares its storage with `elements`, so writes through either one
+        are visible in the other. This is how callers that already hold NumPy data
+        (e.g. Array2D) build an Array without going element by element through __init__.
+        
+        Raises:
+          ValueError: If elements is not a one-dimensional NumPy array.
+        """
+        if not isinstance(elements, np.ndarray) or elements.ndim != 1:
+            raise ValueError("elements must be a one-dimensional NumPy array")
+        array: Array[T] = Array.__new__(Array)
+        array.__logical_size = len(elements)
+        array.__physical_size = len(elements)
+        array.__data_type = data_type
+        array.__elements = elements
+        return array
+
+    def to_numpy(self) -> NDArray:
+        """
+        Return a NumPy view of the used elements of the array.
+        
+        The view shares storage with the Array, so it can be used for vectorized reads
+        and writes. Writes through the view skip the data_type check done by __setitem__.
+        """
+        return self.__elements[:self.__logical_size]
+
     @overload
     def __getitem__(self, index: int) -> T: ...
     @overload
@@ -1,38 +1,80 @@
 from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import copy
+import hashlib
+from multiprocessing import shared_memory
 import os
-from typing import Iterator, Sequence
+import pickle
+from typing import Callable, Iterable, Iterator, Optional, Sequence, TextIO, Tuple
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
 
 from datastructures.iarray import IArray
 from datastructures.array import Array
 from datastructures.iarray2d import IArray2D, T
+from datastructures.tiledarray2d import TiledArray2D, map_file
+
+def _apply_band_in_process(fn: Callable[[NDArray], NDArray], source_name: str, shape: Tuple[int, int], source_dtype: str,
+                           result_name: str, result_dtype: str, start: int, stop: int, halo: int) -> None:
+    # Worker for Array2D.parallel_apply(backend='process'): attach to both shared blocks, run fn on one band
+    # and write the rows the band owns straight into the shared result
+    source_block = shared_memory.SharedMemory(name=source_name)
+    result_block = shared_memory.SharedMemory(name=result_name)
+    try:
+        source = np.ndarray(shape, dtype=source_dtype, buffer=source_block.buf)
+        result = np.ndarray(shape, dtype=result_dtype, buffer=result_block.buf)
+        low, high = max(0, start - halo), min(shape[0], stop + halo)
+        band = source[low:high]
+        band.flags.writeable = False
+        result[start:stop] = np.asarray(fn(band))[start - low:stop - low]
+        del source, result, band
+    finally:
+        source_block.close()
+        result_block.close()
+
 
 class Array2D(IArray2D[T]):
 
+    # Boundary names accepted by convolve / neighbor_sum mapped onto np.pad modes
+    __PAD_MODES = {'zero': 'constant', 'wrap': 'wrap', 'reflect': 'reflect'}
+
     class Row(IArray2D.IRow[T]):
-        def __init__(self, row_index: int, array: IArray, num_columns: int) -> None:
-            # Initialize Row with row_index, the array it belongs to, and the number of columns
+        def __init__(self, row_index: int, array: IArray, num_columns: int, on_write: Optional[Callable[[int, int], None]] = None, stride: Optional[int] = None) -> None:
+            # Initialize Row with row_index, the array it belongs to, and the number of columns.
+            # on_write is called with (row, column) after every write so the owning Array2D can drop cached state.
+            # stride is the length of a stored row, which is larger than num_columns when spare column capacity is reserved
             self.__row_index = row_index
             self.__array = array
             self.__num_columns = num_columns
+            self.__on_write = on_write
+            self.__stride = num_columns if stride is None else stride
 
         def map_index(self, row_index: int, col_index: int) -> int:
             # Calculate the index in the underlying 1D array for the 2D coordinates
-            return row_index * self.__num_columns + col_index
+            return row_index * self.__stride + col_index
         
         def __getitem__(self, column_index: int) -> T:
             # Get the item at the specified column_index in this row
-            if column_index >= self.__num_columns:
-                raise IndexError("Column index out of range")
+            column_index = self.__check_column(column_index)
             index: int = self.map_index(self.__row_index, column_index)
             return self.__array[index]
         
         def __setitem__(self, column_index: int, value: T) -> None:
             # Set the item at the specified column_index in this row
-            if column_index >= self.__num_columns:
-                raise IndexError("Column index out of range")
+            column_index = self.__check_column(column_index)
             index: int = self.map_index(self.__row_index, column_index)
             self.__array[index] = value
+            if self.__on_write is not None:
+                self.__on_write(self.__row_index, column_index)
         
+        def __check_column(self, column_index: int) -> int:
+            # Count negative indices from the last used column; the stored row may have spare capacity past it
+            if column_index < 0:
+                column_index += self.__num_columns
+            if not 0 <= column_index < self.__num_columns:
+                raise IndexError("Column index out of range")
+            return column_index
+
         def __iter__(self) -> Iterator[T]:
             # Allow iteration over items in this row
             return (self[i] for i in range(self.__num_columns))
@@ -71,30 +113,479 @@ class Array2D(IArray2D[T]):
         
         py_list = [item for row in starting_sequence for item in row]
         self.__elements2d = Array(starting_sequence=py_list, data_type=self.__data_type)
+        # The backing Array holds row_capacity x col_capacity cells; only the top-left rows_len x cols_len are in use
+        self.__row_capacity = self.__rows_len
+        self.__col_capacity = self.__cols_len
+        self.__digest: Optional[str] = None
+        self.__mmap: Optional[np.memmap] = None
+        self.__dirty: Optional[set] = None
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Array2D):
             return False
         if self.__rows_len != other.__rows_len or self.__cols_len != other.__cols_len:
             return False
-        for row in range(self.__rows_len):
-            for col in range(self.__cols_len):
-                if self[row][col] != other[row][col]:
-                    return False
-        return True
-        
+        # Two already-computed fingerprints that differ settle it without touching the cells
+        if self.__digest is not None and other.__digest is not None and self.__digest != other.__digest:
+            return False
+        return bool(np.array_equal(self.__values(), other.__values()))
+
+    def digest(self) -> str:
+        # Content fingerprint of the grid (shape, dtype and every cell) as a hex string.
+        # Numeric and bool grids cache it until the next write through a Row.
+        # Object grids (e.g. Cell) are recomputed every call because their items can change in place
+        if self.__digest is not None:
+            return self.__digest
+        values = self.__values()
+        hasher = hashlib.blake2b(f"{values.dtype.str}:{self.__rows_len}x{self.__cols_len}:".encode(), digest_size=16)
+        if values.dtype == object:
+            try:
+                hasher.update(pickle.dumps(values.tolist()))
+            except Exception:
+                hasher.update(repr(values.tolist()).encode())
+            return hasher.hexdigest()
+        hasher.update(np.ascontiguousarray(values).tobytes())
+        self.__digest = hasher.hexdigest()
+        return self.__digest
+
+    def __cell_written(self, row_index: int, column_index: int) -> None:
+        # Called by Row after every write
+        self.__digest = None
+        if self.__dirty is not None:
+            self.__mark_dirty(row_index, row_index + 1, column_index, column_index + 1)
+
+    def __rows_changed(self, start: int, stop: int) -> None:
+        # Called after bulk changes to whole rows [start, stop). Rows past the new end count too, since they disappeared
+        self.__region_changed(start, stop, 0, self.__cols_len)
+
+    def __region_changed(self, row_start: int, row_stop: int, col_start: int, col_stop: int) -> None:
+        # Called after bulk changes to the block [row_start, row_stop) x [col_start, col_stop)
+        self.__digest = None
+        if self.__dirty is not None:
+            self.__mark_dirty(row_start, row_stop, col_start, col_stop)
+
+    def track_dirty(self, granularity: Optional[str] = 'row', tile: Tuple[int, int] = (64, 64)) -> None:
+        # Start recording which parts of the grid are written so incremental consumers (renderers, savers,
+        # replicators) only handle what changed. granularity is:
+        #   'row'  - take_dirty() returns row indexes
+        #   'tile' - take_dirty() returns (tile_row, tile_col) pairs for tiles of the given size
+        #   'cell' - take_dirty() returns (row, col) pairs
+        # Passing None stops tracking. Turning tracking on starts with a clean slate.
+        # Cells changed in place (e.g. cell.is_alive = True on an object grid) are not writes and are not seen
+        if granularity is None:
+            self.__dirty = None
+            return
+        if granularity not in ('row', 'tile', 'cell'):
+            raise ValueError("granularity must be 'row', 'tile', 'cell' or None")
+        if tile[0] <= 0 or tile[1] <= 0:
+            raise ValueError("tile dimensions must be positive")
+        self.__dirty_granularity = granularity
+        self.__dirty_tile = tile
+        self.__dirty = set()
+
+    def take_dirty(self) -> set:
+        # Return everything written since tracking started or since the last call, and start over
+        if self.__dirty is None:
+            raise ValueError("Dirty tracking is off; call track_dirty() first")
+        dirty, self.__dirty = self.__dirty, set()
+        return dirty
+
+    def __mark_dirty(self, row_start: int, row_stop: int, col_start: int, col_stop: int) -> None:
+        if self.__dirty_granularity == 'row':
+            self.__dirty.update(range(row_start, row_stop))
+        elif self.__dirty_granularity == 'cell':
+            self.__dirty.update((row, col) for row in range(row_start, row_stop) for col in range(col_start, col_stop))
+        elif row_start < row_stop and col_start < col_stop:
+            tile_rows, tile_cols = self.__dirty_tile
+            self.__dirty.update((tile_row, tile_col)
+                                for tile_row in range(row_start // tile_rows, (row_stop - 1) // tile_rows + 1)
+                                for tile_col in range(col_start // tile_cols, (col_stop - 1) // tile_cols + 1))
+
+    @staticmethod
+    def from_numpy(values: NDArray, data_type: type = object) -> Array2D:
+        # Create an Array2D from a two-dimensional NumPy array with one bulk copy instead of going cell by cell.
+        # The grid gets its own copy, so later writes to values can't change it behind the cached digest.
+        # When data_type is left as object it is inferred from the dtype (int, float, bool, ...)
+        if not isinstance(values, np.ndarray) or values.ndim != 2:
+            raise ValueError("values must be a two-dimensional NumPy array")
+        return Array2D.__adopt(np.array(values, order='C'), data_type)
+
+    @staticmethod
+    def __adopt(values: NDArray, data_type: type = object) -> Array2D:
+        # from_numpy without the copy, for arrays built here that nothing else holds
+        if data_type == object and values.dtype != object:
+            data_type = type(np.zeros(1, dtype=values.dtype)[0].item())
+        rows, cols = values.shape
+        return Array2D.__wrap(np.ascontiguousarray(values).reshape(-1), rows, cols, data_type)
+
+    @staticmethod
+    def open_mmap(path: str | os.PathLike, rows: int, cols: int, dtype: DTypeLike = float, mode: Optional[str] = None, tile: Optional[Tuple[int, int]] = None) -> Array2D | TiledArray2D:
+        # Open (or create) a rows x cols grid kept in a raw binary file and mapped into memory with np.memmap.
+        # Only the pages that are touched get loaded, so grids far larger than RAM work, and reopening the same
+        # file with the same rows, cols and dtype resumes it instantly; a different layout raises ValueError.
+        # mode follows np.memmap ('r', 'r+', 'w+'); by default an existing file is opened read/write and a missing one is created.
+        # With tile=(tile_rows, tile_cols) the file is laid out tile by tile and a TiledArray2D is returned,
+        # so reading a rectangular region touches contiguous pages instead of one strip per row.
+        # A memory-mapped Array2D has a fixed shape; call flush() to push writes to disk.
+        if tile is not None:
+            return TiledArray2D.open(path, rows, cols, dtype, tile=tile, mode=mode)
+        storage = map_file(path, (rows * cols,), dtype, mode, layout={'rows': rows, 'cols': cols})
+        data_type = type(np.zeros(1, dtype=storage.dtype)[0].item())
+        return Array2D.__wrap(storage, rows, cols, data_type, mmap=storage)
+
+    @staticmethod
+    def __wrap(storage: NDArray, rows: int, cols: int, data_type: type, mmap: Optional[np.memmap] = None) -> Array2D:
+        # Build an Array2D directly on top of flat storage of exactly rows * cols cells
+        array2d: Array2D = Array2D.__new__(Array2D)
+        array2d.__data_type = data_type
+        array2d.__rows_len, array2d.__cols_len = rows, cols
+        array2d.__row_capacity, array2d.__col_capacity = rows, cols
+        array2d.__elements2d = Array.from_numpy(storage, data_type=data_type)
+        array2d.__digest = None
+        array2d.__mmap = mmap
+        array2d.__dirty = None
+        return array2d
+
+    def flush(self) -> None:
+        # Write pending changes of a memory-mapped Array2D to disk. Does nothing for in-memory grids
+        if self.__mmap is not None:
+            self.__mmap.flush()
+
+    def to_numpy(self) -> NDArray:
+        # Return a read-only (rows, cols) NumPy view of the grid for vectorized reads
+        view = self.__values()
+        view.flags.writeable = False
+        return view
+
+    def __storage(self) -> NDArray:
+        # The whole backing Array, spare capacity included, viewed as a (row_capacity, col_capacity) NumPy array
+        return self.__elements2d.to_numpy().reshape(self.__row_capacity, self.__col_capacity)
+
+    def __values(self) -> NDArray:
+        # The cells in use viewed as a (rows, cols) NumPy array. Shares storage, so writes go through
+        return self.__storage()[:self.__rows_len, :self.__cols_len]
+
+    def append_row(self, values: Sequence[T]) -> None:
+        # Add a row at the bottom. Row capacity doubles when full, so appends are amortized O(cols).
+        # A grid with no rows takes its column count from the first row appended
+        self.insert_row(self.__rows_len, values)
+
+    def insert_row(self, row_index: int, values: Sequence[T]) -> None:
+        # Insert a row before row_index, shifting the rows below it down by one
+        self.__check_resizable()
+        if row_index < 0:
+            row_index += self.__rows_len
+        if row_index < 0 or row_index > self.__rows_len:
+            raise IndexError("Row index out of range")
+        columns = len(values) if self.__rows_len == 0 else self.__cols_len
+        self.__check_line(values, columns)
+        self.__reserve(self.__rows_len + 1, columns)
+        self.__cols_len = columns
+        storage = self.__storage()
+        storage[row_index + 1:self.__rows_len + 1, :self.__cols_len] = storage[row_index:self.__rows_len, :self.__cols_len]
+        self.__rows_len += 1
+        self.__write_line(storage[row_index, :self.__cols_len], values)
+        self.__rows_changed(row_index, self.__rows_len)
+
+    def delete_row(self, row_index: int) -> None:
+        # Remove the row at row_index, shifting the rows below it up by one
+        self.__check_resizable()
+        if row_index < 0:
+            row_index += self.__rows_len
+        if row_index < 0 or row_index >= self.__rows_len:
+            raise IndexError("Row index out of range")
+        storage = self.__storage()
+        storage[row_index:self.__rows_len - 1, :self.__cols_len] = storage[row_index + 1:self.__rows_len, :self.__cols_len]
+        self.__rows_len -= 1
+        if storage.dtype == object:
+            # drop references held by the vacated row
+            storage[self.__rows_len, :] = None
+        self.__shrink()
+        self.__rows_changed(row_index, self.__rows_len + 1)
+
+    def append_column(self, values: Sequence[T]) -> None:
+        # Add a column on the right. Column capacity doubles when full, so appends are amortized O(rows)
+        self.__check_resizable()
+        self.__check_line(values, self.__rows_len)
+        self.__reserve(self.__rows_len, self.__cols_len + 1)
+        self.__cols_len += 1
+        self.__write_line(self.__storage()[:self.__rows_len, self.__cols_len - 1], values)
+        self.__region_changed(0, self.__rows_len, self.__cols_len - 1, self.__cols_len)
+
+    def resize(self, rows: int, cols: int, fill: Optional[T] = None) -> None:
+        # Change the shape to rows x cols, keeping the overlapping top-left cells.
+        # New cells get fill, or data_type() when fill is None; object cells each get their own copy
+        self.__check_resizable()
+        if rows < 0 or cols < 0:
+            raise ValueError("rows and cols must not be negative")
+        if fill is not None and not isinstance(fill, self.__data_type):
+            raise TypeError(f"fill must be of type {self.__data_type.__name__}")
+        old_rows, old_cols = self.__rows_len, self.__cols_len
+        self.__reserve(rows, cols)
+        storage = self.__storage()
+        self.__rows_len, self.__cols_len = rows, cols
+        self.__fill(storage[:min(old_rows, rows), old_cols:cols], fill)
+        self.__fill(storage[old_rows:rows, :cols], fill)
+        if storage.dtype == object:
+            storage[rows:, :] = None
+            storage[:, cols:] = None
+        self.__shrink()
+        # Only the cells that appeared or disappeared changed: the columns past the narrower width in the
+        # rows both shapes share, and every row past the shorter height
+        kept_rows = min(old_rows, rows)
+        self.__region_changed(0, kept_rows, min(old_cols, cols), max(old_cols, cols))
+        self.__region_changed(kept_rows, max(old_rows, rows), 0, max(old_cols, cols))
+
+    def parallel_apply(self, fn: Callable[[NDArray], NDArray], bands: Optional[int] = None, halo: int = 0,
+                       backend: str = 'thread', dtype: Optional[DTypeLike] = None) -> Array2D:
+        # Split the grid into bands of whole rows, run fn on every band concurrently and stitch the results into a new Array2D.
+        # fn gets a read-only NumPy view of its band plus up to halo extra rows above and below (fewer at the grid edges)
+        # and must return an array of the same shape; the halo rows of the result are dropped when stitching.
+        # backend='thread' suits fn that release the GIL (most NumPy work). backend='process' copies the grid into
+        # shared memory once, and each worker process writes its rows straight into a shared result, so fn must be
+        # picklable (a module-level function) and the grid numeric or bool. The result dtype is dtype if given,
+        # otherwise the grid's own dtype. bands defaults to the number of CPUs.
+        if bands is None:
+            bands = os.cpu_count() or 1
+        if bands <= 0:
+            raise ValueError("bands must be positive")
+        if halo < 0:
+            raise ValueError("halo must not be negative")
+        values = self.to_numpy()
+        result_dtype = np.dtype(values.dtype if dtype is None else dtype)
+        bounds = [(int(band[0]), int(band[-1]) + 1) for band in np.array_split(np.arange(self.__rows_len), bands) if len(band)]
+        if backend == 'thread':
+            return self.__apply_in_threads(fn, values, bounds, halo, result_dtype)
+        if backend == 'process':
+            return self.__apply_in_processes(fn, values, bounds, halo, result_dtype)
+        raise ValueError("backend must be 'thread' or 'process'")
+
+    @staticmethod
+    def __apply_in_threads(fn: Callable[[NDArray], NDArray], values: NDArray, bounds: list[Tuple[int, int]], halo: int, result_dtype: np.dtype) -> Array2D:
+        result = np.empty(values.shape, dtype=result_dtype)
+
+        def run(start: int, stop: int) -> None:
+            low, high = max(0, start - halo), min(values.shape[0], stop + halo)
+            result[start:stop] = np.asarray(fn(values[low:high]))[start - low:stop - low]
+
+        with ThreadPoolExecutor(max_workers=max(1, len(bounds))) as executor:
+            for future in [executor.submit(run, start, stop) for start, stop in bounds]:
+                future.result()
+        return Array2D.__adopt(result)
+
+    @staticmethod
+    def __apply_in_processes(fn: Callable[[NDArray], NDArray], values: NDArray, bounds: list[Tuple[int, int]], halo: int, result_dtype: np.dtype) -> Array2D:
+        if values.dtype.hasobject or result_dtype.hasobject:
+            raise ValueError("backend='process' only works with numeric or bool grids")
+        source_block = shared_memory.SharedMemory(create=True, size=max(1, values.nbytes))
+        result_block = shared_memory.SharedMemory(create=True, size=max(1, values.size * result_dtype.itemsize))
+        try:
+            source = np.ndarray(values.shape, dtype=values.dtype, buffer=source_block.buf)
+            source[...] = values
+            with ProcessPoolExecutor(max_workers=max(1, len(bounds))) as executor:
+                futures = [executor.submit(_apply_band_in_process, fn, source_block.name, values.shape, values.dtype.str,
+                                           result_block.name, result_dtype.str, start, stop, halo) for start, stop in bounds]
+                for future in futures:
+                    future.result()
+            result = np.ndarray(values.shape, dtype=result_dtype, buffer=result_block.buf).copy()
+            del source
+        finally:
+            source_block.close()
+            source_block.unlink()
+            result_block.close()
+            result_block.unlink()
+        return Array2D.__adopt(result)
+
+    @staticmethod
+    def from_text(fileobj: Iterable[str], parser: Optional[Callable[[str], Optional[Sequence[T]]]] = None, chunk_rows: int = 1024,
+                  data_type: type = float, delimiter: str = ',', max_rows: Optional[int] = None) -> Array2D:
+        # Build an Array2D from text one line per row, e.g. an open CSV file.
+        # Lines are parsed in chunks of chunk_rows and each chunk is copied into the backing storage in one go,
+        # so memory stays bounded by the chunk no matter how large the file is.
+        # parser turns a line into a row of data_type items, or None to skip the line (comments, headers, ...).
+        # By default lines are split on delimiter, each field is converted with data_type and blank lines are skipped.
+        # Reading stops after max_rows rows when it is given.
+        if chunk_rows <= 0:
+            raise ValueError("chunk_rows must be positive")
+        array2d: Array2D = Array2D.empty(0, 0, data_type=data_type)
+        row_parser = parser or Array2D.__default_parser(data_type, delimiter)
+        chunk: list[Sequence[T]] = []
+        for line in fileobj:
+            if max_rows is not None and array2d.__rows_len + len(chunk) >= max_rows:
+                break
+            row = row_parser(line)
+            if row is None:
+                continue
+            if parser is not None:
+                # A custom parser might hand back anything; the default one already produces data_type
+                array2d.__check_line(row, len(row))
+            chunk.append(row)
+            if len(chunk) == chunk_rows:
+                array2d.__append_block(chunk)
+                chunk = []
+        array2d.__append_block(chunk)
+        return array2d
+
+    def to_text(self, fileobj: TextIO, formatter: Callable[[T], str] = str, delimiter: str = ',', chunk_rows: int = 1024) -> None:
+        # Write the grid one line per row, items converted with formatter and joined by delimiter.
+        # Rows are formatted and written chunk_rows at a time. from_text reads the output back with the same delimiter
+        if chunk_rows <= 0:
+            raise ValueError("chunk_rows must be positive")
+        values = self.__values()
+        for start in range(0, self.__rows_len, chunk_rows):
+            lines = (delimiter.join(map(formatter, row)) + '\n' for row in values[start:start + chunk_rows].tolist())
+            fileobj.writelines(lines)
+
+    @staticmethod
+    def __default_parser(data_type: type, delimiter: str) -> Callable[[str], Optional[Sequence[T]]]:
+        # Split on delimiter and convert every field with data_type; bools also accept the text that to_text writes
+        convert = (lambda field: field.strip() in ('True', 'true', '1')) if data_type is bool else data_type
+        def parse(line: str) -> Optional[Sequence[T]]:
+            if not line.strip():
+                return None
+            return [convert(field) for field in line.rstrip('\r\n').split(delimiter)]
+        return parse
+
+    def __append_block(self, rows: Sequence[Sequence[T]]) -> None:
+        # Append several rows at once with a single copy into the storage
+        if not rows:
+            return
+        columns = len(rows[0]) if self.__rows_len == 0 else self.__cols_len
+        if any(len(row) != columns for row in rows):
+            raise ValueError(f"All rows must have {columns} items")
+        self.__reserve(self.__rows_len + len(rows), columns)
+        self.__cols_len = columns
+        storage = self.__storage()
+        block = np.empty((len(rows), columns), dtype=storage.dtype)
+        if storage.dtype == object:
+            for row_index, row in enumerate(rows):
+                self.__write_line(block[row_index], row)
+        else:
+            block[...] = rows
+        storage[self.__rows_len:self.__rows_len + len(rows), :columns] = block
+        self.__rows_len += len(rows)
+        self.__rows_changed(self.__rows_len - len(rows), self.__rows_len)
+
+    def __check_resizable(self) -> None:
+        # The shape of a memory-mapped grid is fixed by its file
+        if self.__mmap is not None:
+            raise ValueError("A memory-mapped Array2D cannot change shape")
+
+    def __check_line(self, values: Sequence[T], length: int) -> None:
+        # Validate a row or column about to be written
+        if len(values) != length:
+            raise ValueError(f"Expected {length} items but got {len(values)}")
+        if not all(isinstance(item, self.__data_type) for item in values):
+            raise TypeError(f"All items must be of type {self.__data_type.__name__}")
+
+    @staticmethod
+    def __write_line(target: NDArray, values: Sequence[T]) -> None:
+        # Copy a row or column into a 1D storage view. Object items are deep-copied one by one, like __init__ does,
+        # so the grid never shares them with the caller (and numpy does not unpack them)
+        if target.dtype == object:
+            for index, item in enumerate(values):
+                target[index] = copy.deepcopy(item)
+        else:
+            target[:] = values
+
+    def __fill(self, block: NDArray, fill: Optional[T]) -> None:
+        # Fill a storage block with new default cells
+        if block.size == 0:
+            return
+        if block.dtype != object:
+            block[...] = self.__data_type() if fill is None else fill
+            return
+        for index in np.ndindex(block.shape):
+            block[index] = self.__data_type() if fill is None else copy.deepcopy(fill)
+
+    def __reserve(self, rows: int, cols: int) -> None:
+        # Make sure the storage can hold rows x cols, doubling whichever capacity is too small
+        if rows <= self.__row_capacity and cols <= self.__col_capacity:
+            return
+        row_capacity = self.__row_capacity if rows <= self.__row_capacity else max(rows, 2 * self.__row_capacity)
+        col_capacity = self.__col_capacity if cols <= self.__col_capacity else max(cols, 2 * self.__col_capacity)
+        self.__reallocate(row_capacity, col_capacity)
+
+    def __shrink(self) -> None:
+        # Halve a capacity once no more than a quarter of it is in use, so shrinking is also amortized
+        row_capacity, col_capacity = self.__row_capacity, self.__col_capacity
+        if self.__rows_len <= row_capacity // 4:
+            row_capacity //= 2
+        if self.__cols_len <= col_capacity // 4:
+            col_capacity //= 2
+        if (row_capacity, col_capacity) != (self.__row_capacity, self.__col_capacity):
+            self.__reallocate(row_capacity, col_capacity)
+
+    def __reallocate(self, row_capacity: int, col_capacity: int) -> None:
+        # Move the cells in use into new storage of the given capacity
+        values = self.__values()
+        storage = np.empty((row_capacity, col_capacity), dtype=values.dtype)
+        storage[:self.__rows_len, :self.__cols_len] = values
+        self.__elements2d = Array.from_numpy(storage.reshape(-1), data_type=self.__data_type)
+        self.__row_capacity, self.__col_capacity = row_capacity, col_capacity
+
+    def convolve(self, kernel: Sequence[Sequence[T]] | Array2D | NDArray, boundary: str = 'zero') -> Array2D:
+        # Convolve the whole grid with an odd-sized kernel in one vectorized pass per kernel cell.
+        # The kernel is flipped as in a true convolution, so symmetric kernels behave like a stencil.
+        # boundary decides what lies outside the grid, using np.pad semantics:
+        #   'zero'    - cells outside the grid are 0
+        #   'wrap'    - the grid wraps around like a torus
+        #   'reflect' - the grid is mirrored about its edge cells (the edge itself is not repeated)
+        # Returns a new Array2D of the same shape; the original grid is left untouched.
+        if boundary not in self.__PAD_MODES:
+            raise ValueError(f"boundary must be one of {', '.join(self.__PAD_MODES)}")
+        weights = np.asarray(kernel.to_numpy() if isinstance(kernel, Array2D) else kernel)
+        if weights.ndim != 2 or weights.shape[0] % 2 == 0 or weights.shape[1] % 2 == 0:
+            raise ValueError("kernel must be a two-dimensional sequence with an odd number of rows and columns")
+        values = self.__values()
+        for array in (values, weights):
+            if not (np.issubdtype(array.dtype, np.number) or np.issubdtype(array.dtype, np.bool_)):
+                raise TypeError("convolve only supports numeric or bool data")
+
+        # bools are summed as integers, never or-ed together
+        accumulate_dtype = np.int64 if values.dtype == np.bool_ else values.dtype
+        result_dtype = np.result_type(accumulate_dtype, weights.dtype)
+        result = np.zeros(values.shape, dtype=result_dtype)
+        if values.size == 0:
+            return Array2D.__adopt(result)
+
+        pad_rows, pad_cols = weights.shape[0] // 2, weights.shape[1] // 2
+        padded = np.pad(values.astype(result_dtype), ((pad_rows, pad_rows), (pad_cols, pad_cols)), mode=self.__PAD_MODES[boundary])
+        flipped = weights[::-1, ::-1]
+        for row_offset in range(weights.shape[0]):
+            for col_offset in range(weights.shape[1]):
+                weight = flipped[row_offset, col_offset]
+                if weight:
+                    result += weight * padded[row_offset:row_offset + self.__rows_len, col_offset:col_offset + self.__cols_len]
+        return Array2D.__adopt(result)
+
+    def neighbor_sum(self, radius: int = 1, boundary: str = 'zero') -> Array2D:
+        # Sum of every cell's neighbors within radius (the square Moore neighborhood), excluding the cell itself.
+        # For a bool grid with radius 1 this is the live-neighbor count used by the Game of Life
+        if radius < 0:
+            raise ValueError("radius must not be negative")
+        size = 2 * radius + 1
+        kernel = np.ones((size, size), dtype=np.int64)
+        kernel[radius, radius] = 0
+        return self.convolve(kernel, boundary=boundary)
 
     @staticmethod
     def empty(rows: int = 0, cols: int = 0, data_type: type = object) -> Array2D:
         # Create an empty Array2D with the specified rows, columns, and data type
+        if rows == 0 or cols == 0:
+            # Nothing to infer a shape from, so go straight to the storage. Useful as a start for append_row
+            dtype = data_type if data_type in (bool, int, float, complex) else object
+            return Array2D.__adopt(np.empty((rows, cols), dtype=dtype), data_type=data_type)
         sequence2d = [[data_type() for _ in range(cols)] for _ in range(rows)]
         return Array2D(starting_sequence=sequence2d, data_type=data_type)
 
     def __getitem__(self, row_index: int) -> Array2D.IRow[T]: 
-        # Get the row at the specified row_index
-        if row_index >= self.__rows_len:
+        # Get the row at the specified row_index. Negative indices count from the last used row, not the spare capacity
+        if row_index < 0:
+            row_index += self.__rows_len
+        if not 0 <= row_index < self.__rows_len:
             raise IndexError("Row index out of range")
-        return self.Row(row_index=row_index, array=self.__elements2d, num_columns=self.__cols_len)    
+        return self.Row(row_index=row_index, array=self.__elements2d, num_columns=self.__cols_len, on_write=self.__cell_written, stride=self.__col_capacity)    
     
     def __iter__(self) -> Iterator[Sequence[T]]:
         # Allow iteration over rows in the 2D array
@@ -107,6 +598,11 @@ class Array2D(IArray2D[T]):
     def __len__(self) -> int:
         # Return the number of rows in the 2D array
         return self.__rows_len
+
+    @property
+    def data_type(self) -> type:
+        # The type every cell holds
+        return self.__data_type
                                   
     def __str__(self) -> str: 
         # Return string representation of the 2D array
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import os
+import threading
+import time
+from typing import Any, Iterator, List, Optional
+from datastructures.iqueue import IQueue, T
+
+
+class ConcurrentDeque[T](IQueue[T]):
+    """
+    A thread-safe queue for producer/consumer pipelines (a two-lock queue).
+
+    The list always starts with a dummy node: enqueue only touches the tail under the tail lock and dequeue
+    only touches the head under the head lock, so producers and consumers don't contend with each other.
+    A semaphore counts the items, which lets dequeue block until one arrives. The rarely used operations
+    that need both ends (enqueue_front, dequeue_back, clear, snapshots) take both locks, head lock first.
+    """
+
+    @dataclass(slots=True, eq=False)
+    class Node:
+        data: Any
+        next: Optional[ConcurrentDeque.Node] = None
+
+    def __init__(self, data_type: type = object) -> None:
+        """
+        Initializes the deque with a specified data type.
+
+        Args:
+            - data_type (type): The type of data the deque will hold.
+        """
+        self.__data_type = data_type
+        self.__head = self.__tail = ConcurrentDeque.Node(data=None)  # the dummy node
+        self.__head_lock = threading.Lock()
+        self.__tail_lock = threading.Lock()
+        self.__items = threading.Semaphore(0)
+        # Each counter is only written under its own lock, so len() needs neither
+        self.__enqueued = 0
+        self.__dequeued = 0
+
+    def enqueue(self, item: T) -> None:
+        """
+        Adds an item to the back of the deque and wakes one waiting consumer.
+
+        Args:
+            - item (T): The item to add to the back of the deque.
+
+        Raises:
+            - TypeError: If the item is not of the correct type.
+        """
+        self.__check_type(item)
+        node = ConcurrentDeque.Node(data=item)
+        with self.__tail_lock:
+            self.__tail.next = node
+            self.__tail = node
+            self.__enqueued += 1
+        self.__items.release()
+
+    def dequeue(self, timeout: Optional[float] = None) -> T:
+        """
+        Removes and returns the item from the front of the deque, waiting for one if the deque is empty.
+
+        Args:
+            - timeout (float | None): The longest time to wait, in seconds. None waits forever, 0 doesn't wait.
+
+        Returns:
+            - T: The item removed from the front of the deque.
+
+        Raises:
+            - IndexError: If no item arrived within the timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            if not self.__items.acquire(timeout=remaining):
+                raise IndexError("ConcurrentDeque is empty")
+            with self.__head_lock:
+                first = self.__head.next
+                if first is not None:
+                    return self.__take_first(first)
+            # The item this permit stood for was removed by clear(); wait for the next one
+
+    def try_dequeue(self, default: Optional[T] = None) -> Optional[T]:
+        """
+        Removes and returns the item from the front of the deque without waiting.
+
+        Args:
+            - default (T | None): What to return when the deque is empty.
+
+        Returns:
+            - T | None: The item removed from the front of the deque, or default.
+        """
+        try:
+            return self.dequeue(timeout=0)
+        except IndexError:
+            return default
+
+    def enqueue_front(self, item: T) -> None:
+        """
+        Adds an item to the front of the deque. Takes both locks.
+
+        Args:
+            - item (T): The item to add to the front of the deque.
+
+        Raises:
+            - TypeError: If the item is not of the correct type.
+        """
+        self.__check_type(item)
+        node = ConcurrentDeque.Node(data=item)
+        with self.__head_lock, self.__tail_lock:
+            node.next = self.__head.next
+            self.__head.next = node
+            if self.__tail is self.__head:
+                self.__tail = node
+            self.__enqueued += 1
+        self.__items.release()
+
+    def dequeue_back(self) -> T:
+        """
+        Removes and returns the item from the back of the deque without waiting.
+        Takes both locks and walks the list, so it is O(n); use dequeue on hot paths.
+
+        Returns:
+            - T: The item removed from the back of the deque.
+
+        Raises:
+            - IndexError: If the deque is empty.
+        """
+        if not self.__items.acquire(blocking=False):
+            raise IndexError("ConcurrentDeque is empty")
+        with self.__head_lock, self.__tail_lock:
+            if self.__tail is self.__head:
+                raise IndexError("ConcurrentDeque is empty")
+            previous = self.__head
+            while previous.next is not self.__tail:
+                previous = previous.next
+            data = self.__tail.data
+            previous.next = None
+            self.__tail = previous
+            self.__dequeued += 1
+            return data
+
+    def front(self) -> T:
+        """
+        Returns the front item of the deque without removing it.
+
+        Returns:
+            - T: The front item of the deque.
+
+        Raises:
+            - IndexError: If the deque is empty.
+        """
+        with self.__head_lock:
+            first = self.__head.next
+            if first is None:
+                raise IndexError("ConcurrentDeque is empty")
+            return first.data
+
+    def back(self) -> T:
+        """
+        Returns the back item of the deque without removing it.
+
+        Returns:
+            - T: The back item of the deque.
+
+        Raises:
+            - IndexError: If the deque is empty.
+        """
+        with self.__head_lock, self.__tail_lock:
+            if self.__tail is self.__head:
+                raise IndexError("ConcurrentDeque is empty")
+            return self.__tail.data
+
+    def empty(self) -> bool:
+        """
+        Checks if the deque is empty. Other threads may change that right after this returns.
+
+        Returns:
+            - bool: True if the deque is empty, False otherwise.
+        """
+        return len(self) == 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of items in the deque at about this moment.
+
+        Returns:
+            - int: The number of items in the deque.
+        """
+        return max(self.__enqueued - self.__dequeued, 0)
+
+    def clear(self) -> None:
+        """
+        Removes all items from the deque.
+        """
+        with self.__head_lock, self.__tail_lock:
+            removed = self.__enqueued - self.__dequeued
+            self.__head.next = None
+            self.__tail = self.__head
+            self.__dequeued = self.__enqueued
+            # Take back the permits of the removed items while no new item can be linked. Consumers that
+            # already hold one find the deque empty and wait again
+            for _ in range(removed):
+                if not self.__items.acquire(blocking=False):
+                    break
+
+    def __contains__(self, item: T) -> bool:
+        """
+        Checks if an item exists in the deque.
+
+        Args:
+            - item (T): The item to check for existence.
+
+        Returns:
+            - bool: True if the item exists in the deque, False otherwise.
+        """
+        return item in self.__snapshot()
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compares the contents of two deques.
+
+        Args:
+            - other (ConcurrentDeque): The deque to compare with.
+
+        Returns:
+            - bool: True if the deques are equal, False otherwise.
+        """
+        if not isinstance(other, ConcurrentDeque):
+            return False
+        return self.__snapshot() == other.__snapshot()
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Iterates over a snapshot of the items, so other threads can keep working meanwhile.
+        """
+        return iter(self.__snapshot())
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the deque.
+
+        Returns:
+            - str: A string representation of the deque.
+        """
+        return '[' + ', '.join(repr(item) for item in self.__snapshot()) + ']'
+
+    def __repr__(self) -> str:
+        """
+        Returns a detailed string representation of the deque.
+
+        Returns:
+            - str: A detailed string representation of the deque.
+        """
+        items = self.__snapshot()
+        return f"ConcurrentDeque({', '.join(repr(item) for item in items)}) Count: {len(items)}"
+
+    def __take_first(self, first: ConcurrentDeque.Node) -> T:
+        # Called with the head lock held: first becomes the new dummy node
+        data = first.data
+        first.data = None
+        self.__head = first
+        self.__dequeued += 1
+        return data
+
+    def __snapshot(self) -> List[T]:
+        with self.__head_lock, self.__tail_lock:
+            items = []
+            current = self.__head.next
+            while current is not None:
+                items.append(current.data)
+                current = current.next
+            return items
+
+    def __check_type(self, item: T) -> None:
+        if not isinstance(item, self.__data_type):
+            raise TypeError(f"Item must be of type {self.__data_type.__name__}")
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'OOPS!\nThis is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
@@ -1,7 +1,8 @@
 import os
 from datastructures.iqueue import IQueue
+from datastructures.ilinkedlist import ILinkedList
 from datastructures.linkedlist import LinkedList
-from typing import TypeVar
+from typing import Optional, TypeVar
 
 T = TypeVar('T')
 
@@ -10,15 +11,28 @@ class Deque[T](IQueue[T]):
     A double-ended queue (deque) implementation.
     """
 
-    def __init__(self, data_type: type = object) -> None:
+    def __init__(self, data_type: type = object, list_type: type[ILinkedList] = LinkedList, indexed: bool = False, check_types: Optional[str] = None) -> None:
         """
         Initializes the deque with a specified data type.
 
         Args:
             - data_type (type): The type of data the deque will hold.
+            - list_type (type[ILinkedList]): The linked list class that stores the items. Long FIFO buffers
+              can pass UnrolledLinkedList to keep many items per node, and FIFO-only queues SinglyLinkedList
+              to save a pointer per item (dequeue_back is then O(n)).
+            - indexed (bool): Keep a value index so `in` is O(1). Items must be hashable, and list_type
+              must accept `indexed` (LinkedList does).
+            - check_types (str | None): 'always', 'debug' or 'never' type-check items (see
+              linkedlist.DEFAULT_CHECK_TYPES, which applies when None). LinkedList, SinglyLinkedList and
+              UnrolledLinkedList all accept it.
         """
         self.__data_type = data_type
-        self.__list = LinkedList(data_type)
+        options = {}
+        if indexed:
+            options['indexed'] = True
+        if check_types is not None:
+            options['check_types'] = check_types
+        self.__list = list_type(data_type, **options)
 
     def enqueue(self, item: T) -> None:
         """
@@ -132,9 +146,10 @@ class Deque[T](IQueue[T]):
         Returns:
             - bool: True if the deques are equal, False otherwise.
         """
-        if not isinstance(other, type(self)):
+        # Compare item by item, so deques backed by different list types compare by content
+        if not isinstance(other, type(self)) or len(self) != len(other):
             return False
-        return self.__list == other.__list
+        return all(mine == theirs for mine, theirs in zip(self.__list, other.__list))
     
     def clear(self):
         """
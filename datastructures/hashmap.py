@@ -1,39 +1,151 @@
+from __future__ import annotations
+
 import copy
-from typing import Callable, Iterator, Optional, Tuple
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Mapping, Optional, Tuple
 from datastructures.ihashmap import KT, VT, IHashMap
 from datastructures.array import Array
 import pickle
 import hashlib
 import math
+import numpy as np
 
 from datastructures.linkedlist import LinkedList
 
+_MISSING = object()  # pop() without a default
+
+
+def build_hash_function(custom_hash_function: Optional[Callable[[Any], int]] = None, hash_strategy: str = 'builtin',
+                        type_hashers: Optional[Mapping[type, Callable[[Any], int]]] = None) -> Callable[[Any], int]:
+    """
+    Pick the key hash function for a hash map. A custom_hash_function wins outright. Otherwise
+    the hash_strategy picks the base function, and type_hashers (looked up by the exact type of the key)
+    take priority over it. Shared by HashMap and OpenHashMap.
+
+    Raises:
+        ValueError: If hash_strategy is not one of HashMap.HASH_STRATEGIES.
+    """
+    if hash_strategy not in HashMap.HASH_STRATEGIES:
+        raise ValueError(f"hash_strategy must be one of {', '.join(HashMap.HASH_STRATEGIES)}")
+    if custom_hash_function:
+        return custom_hash_function
+    base = HashMap._builtin_hash_function if hash_strategy == 'builtin' else HashMap._default_hash_function
+    if not type_hashers:
+        return base
+
+    hashers = dict(type_hashers)
+    def typed_hash_function(key: Any) -> int:
+        hasher = hashers.get(type(key))
+        return hasher(key) if hasher is not None else base(key)
+    return typed_hash_function
+
+
 class HashMap(IHashMap[KT, VT]):
 
-    def __init__(self, number_of_buckets=7, load_factor=0.75, custom_hash_function: Optional[Callable[[KT], int]]=None) -> None:
-        self._buckets: Array[LinkedList[Tuple[KT, VT]]] = Array(starting_sequence=[LinkedList(data_type=tuple) for _ in range(number_of_buckets)],data_type=LinkedList)
+    # 'builtin' hashes keys with hash(), falling back to the stable hash for unhashable keys.
+    # 'stable' always uses the pickle + md5 hash, which gives the same bucket layout in every process
+    # (hash() of str and bytes changes between runs unless PYTHONHASHSEED is fixed) but costs microseconds per key.
+    HASH_STRATEGIES = ('builtin', 'stable')
+
+    # A bucket entry keeps the key's full hash, so resizing never hashes a key again and a lookup
+    # only compares keys (==) when the hashes already match
+    @dataclass(slots=True, eq=False)
+    class _Entry:
+        hash: int
+        key: Any
+        value: Any
+
+    # Incremental resizing moves this many non-empty buckets per write, looking at no more than ten
+    # times as many empty ones. The table doubles, so the move finishes well before the next resize is due
+    REHASH_BUCKETS_PER_STEP = 4
+
+    def __init__(self, number_of_buckets=7, load_factor=0.75, custom_hash_function: Optional[Callable[[KT], int]]=None,
+                 hash_strategy: str = 'builtin', type_hashers: Optional[Mapping[type, Callable[[Any], int]]] = None,
+                 incremental_resize: bool = False) -> None:
+        self._buckets: Array[Optional[LinkedList[HashMap._Entry]]] = self._new_table(number_of_buckets)
         self._count: int = 0
         self._load_factor: float = load_factor
-        self._hash_function = custom_hash_function or self._default_hash_function
+        self._hash_function = build_hash_function(custom_hash_function, hash_strategy, type_hashers)
+        # With incremental_resize a resize only allocates the bigger table. Entries then move over a few buckets
+        # per write (like Redis), and until they all have, lookups check the old table too
+        self._incremental_resize = incremental_resize
+        self._old_buckets: Optional[Array[Optional[LinkedList[HashMap._Entry]]]] = None
+        self._rehash_index: int = 0
+
+    @staticmethod
+    def _new_table(size: int) -> Array[Optional[LinkedList[HashMap._Entry]]]:
+        # Buckets start as None and get a chain on their first insert, so a table costs one NumPy allocation
+        return Array.from_numpy(np.full(size, None, dtype=object), data_type=LinkedList)
 
     def get_bucket_index(self, key: KT, bucket_size:int) -> int:
         bucket_index = self._hash_function(key)
         return bucket_index % bucket_size
 
+    def _locate(self, key: KT) -> Tuple[int, Optional[LinkedList[HashMap._Entry]], Optional[LinkedList.Node]]:
+        # Hash the key once and find its node: returns (hash, bucket chain holding it, node), or (hash, None, None)
+        key_hash = self._hash_function(key)
+        tables = (self._buckets,) if self._old_buckets is None else (self._buckets, self._old_buckets)
+        for table in tables:
+            bucket_chain = table[key_hash % len(table)]
+            if bucket_chain is None:
+                continue
+            for node in bucket_chain.nodes():
+                entry = node.data
+                if entry.hash == key_hash and (entry.key is key or entry.key == key):
+                    return key_hash, bucket_chain, node
+        return key_hash, None, None
+
+    def _insert_entry(self, entry: HashMap._Entry) -> None:
+        # Append an entry to its bucket in the current table, creating the chain if needed
+        index = entry.hash % len(self._buckets)
+        bucket_chain = self._buckets[index]
+        if bucket_chain is None:
+            bucket_chain = LinkedList(data_type=HashMap._Entry, check_types='never')
+            self._buckets[index] = bucket_chain
+        bucket_chain.append(entry)
+
+    def _chains(self) -> Iterator[LinkedList[HashMap._Entry]]:
+        tables = (self._buckets,) if self._old_buckets is None else (self._buckets, self._old_buckets)
+        for table in tables:
+            for bucket_chain in table:
+                if bucket_chain is not None:
+                    yield bucket_chain
+
     def __getitem__(self, key: KT) -> VT:
-        for (k,v) in self._buckets[self.get_bucket_index(key, len(self._buckets))]:
-            if k == key:
-                return v
-        raise KeyError(f"Key: {key} does not exist in the HashMap")
+        _, _, node = self._locate(key)
+        if node is None:
+            raise KeyError(f"Key: {key} does not exist in the HashMap")
+        return node.data.value
     
     def _resize(self):
-        new_size = self._next_prime(len(self._buckets) * 2)
-        new_buckets = Array(starting_sequence=[LinkedList(data_type=tuple) for _ in range(new_size)], data_type=LinkedList)
-        for bucket in self._buckets:
-            for k, v in bucket:
-                new_index = self.get_bucket_index(k, new_size)
-                new_buckets[new_index].append((k, v))
-        self._buckets = new_buckets
+        # Entries move by their cached hash; no key is hashed again
+        if self._old_buckets is not None:
+            self._rehash_step(len(self._old_buckets))  # finish the previous move first
+        old_buckets = self._buckets
+        self._buckets = self._new_table(self._next_prime(len(old_buckets) * 2))
+        if self._incremental_resize:
+            self._old_buckets, self._rehash_index = old_buckets, 0
+            return
+        for bucket_chain in old_buckets:
+            if bucket_chain is not None:
+                for entry in bucket_chain:
+                    self._insert_entry(entry)
+
+    def _rehash_step(self, buckets: int) -> None:
+        # Move up to `buckets` non-empty buckets of the old table into the current one
+        old_buckets = self._old_buckets
+        moved, visited = 0, 0
+        while self._rehash_index < len(old_buckets) and moved < buckets and visited < buckets * 10:
+            bucket_chain = old_buckets[self._rehash_index]
+            if bucket_chain is not None and not bucket_chain.empty:
+                for entry in bucket_chain:
+                    self._insert_entry(entry)
+                bucket_chain.clear()
+                moved += 1
+            visited += 1
+            self._rehash_index += 1
+        if self._rehash_index >= len(old_buckets):
+            self._old_buckets = None
         
     def _next_prime(self, n: int) -> int:
         def is_prime(num: int) -> bool:
@@ -47,55 +159,97 @@ class HashMap(IHashMap[KT, VT]):
             n += 1 
         return n
 
-    def __setitem__(self, key: KT, value: VT) -> None:        
-        if self._count / len(self._buckets) >= self._load_factor:
+    def _before_write(self, inserting: bool = True) -> None:
+        # Only writes move buckets, so reading a map while iterating over it never reshuffles entries
+        if self._old_buckets is not None:
+            self._rehash_step(HashMap.REHASH_BUCKETS_PER_STEP)
+        if inserting and self._count / len(self._buckets) >= self._load_factor:
             self._resize()
-        bucket_index = self.get_bucket_index(key, len(self._buckets))
-        bucket_chain = self._buckets[bucket_index]
-        for i, (k, v) in enumerate(bucket_chain):
-            if k == key:
-                # Update the value for the existing key
-                bucket_chain.remove((k, v))
-                bucket_chain.append((key, value))
-                return
+
+    def __setitem__(self, key: KT, value: VT) -> None:        
+        self._before_write()
+        key_hash, _, node = self._locate(key)
+        if node is not None:
+            # Entries are mutable, so an update overwrites the value where it is
+            node.data.value = value
+            return
         # Add a new key-value pair if the key does not exist
-        bucket_chain.append((key, value))
+        self._insert_entry(HashMap._Entry(key_hash, key, value))
         self._count += 1
 
+    # get, setdefault, pop and update_with each hash the key and walk its bucket once
+
+    def get(self, key: KT, default: Optional[VT] = None) -> Optional[VT]:
+        _, _, node = self._locate(key)
+        return default if node is None else node.data.value
+
+    def setdefault(self, key: KT, default: Optional[VT] = None) -> Optional[VT]:
+        # Return the value for key, first inserting default if key is missing
+        self._before_write()
+        key_hash, _, node = self._locate(key)
+        if node is not None:
+            return node.data.value
+        self._insert_entry(HashMap._Entry(key_hash, key, default))
+        self._count += 1
+        return default
+
+    def pop(self, key: KT, default: Any = _MISSING) -> VT:
+        # Remove key and return its value; return default instead when key is missing, or raise KeyError without one
+        self._before_write(inserting=False)
+        _, bucket_chain, node = self._locate(key)
+        if node is None:
+            if default is _MISSING:
+                raise KeyError(f"Key: {key} does not exist in the HashMap")
+            return default
+        bucket_chain.remove_node(node)
+        self._count -= 1
+        return node.data.value
+
+    def update_with(self, key: KT, fn: Callable[[VT], VT], default: VT) -> VT:
+        # Set key to fn(current value), or to fn(default) when key is missing, and return the new value.
+        # e.g. counts.update_with(word, lambda n: n + 1, 0)
+        self._before_write()
+        key_hash, _, node = self._locate(key)
+        if node is not None:
+            entry = node.data
+            entry.value = fn(entry.value)
+            return entry.value
+        value = fn(default)
+        self._insert_entry(HashMap._Entry(key_hash, key, value))
+        self._count += 1
+        return value
+
     def keys(self) -> Iterator[KT]:
-        for bucket in self._buckets:
-            for k, _ in bucket:
-                yield k
+        for bucket in self._chains():
+            for entry in bucket:
+                yield entry.key
 
     def values(self) -> Iterator[VT]:
-        for bucket in self._buckets:
-            for _, v in bucket:
-                yield v
+        for bucket in self._chains():
+            for entry in bucket:
+                yield entry.value
 
     def items(self) -> Iterator[Tuple[KT, VT]]:
-        for bucket in self._buckets:
-            for k, v in bucket:
-                yield (k, v)
+        for bucket in self._chains():
+            for entry in bucket:
+                yield (entry.key, entry.value)
+
+    @property
+    def rehashing(self) -> bool:
+        # True while an incremental resize is still moving entries out of the old table
+        return self._old_buckets is not None
 
     def __delitem__(self, key: KT) -> None:
-        bucket_index = self.get_bucket_index(key, len(self._buckets))
-        bucket_chain = self._buckets[bucket_index]
-        for k, v in bucket_chain:
-            if k == key:
-                # Use LinkedList's remove method to delete the item
-                bucket_chain.remove((k, v))
-                self._count -= 1
-                return
-        raise KeyError(f"Key: {key} does not exist in the HashMap")
+        self._before_write(inserting=False)
+        _, bucket_chain, node = self._locate(key)
+        if node is None:
+            raise KeyError(f"Key: {key} does not exist in the HashMap")
+        # Unlink the node that was found instead of searching the chain again
+        bucket_chain.remove_node(node)
+        self._count -= 1
 
     def __contains__(self, key: KT) -> bool:
-        bucket_index = self.get_bucket_index(key, len(self._buckets))
-        bucket_chain:LinkedList = self._buckets[bucket_index]
-
-        for k,v in bucket_chain:
-            if k == key:
-                return True
-        return False
+        return self._locate(key)[2] is not None
 
     def __len__(self) -> int:
         return self._count
@@ -120,10 +274,26 @@ class HashMap(IHashMap[KT, VT]):
     def __repr__(self) -> str:
         return f"HashMap({str(self)})"
 
+    @staticmethod
+    def _builtin_hash_function(key: KT) -> int:
+        """
+        Hash function for the 'builtin' strategy: Python's hash(), so each lookup costs nanoseconds.
+        Unhashable keys (lists, dicts, ...) fall back to the stable pickle hash.
+
+        Args:
+            key (KT): The key to hash.
+        Returns:
+            int: The hash value of the key.
+        """
+        try:
+            return hash(key)
+        except TypeError:
+            return HashMap._default_hash_function(key)
+
     @staticmethod
     def _default_hash_function(key: KT) -> int:
         """
-        Default hash function for the HashMap.
+        Stable hash function for the HashMap (the 'stable' strategy).
         Uses Pickle to serialize the key and then hashes it using SHA-256. 
         Uses pickle for serialization (to capture full object structure).
         Falls back to repr() if the object is not pickleable (e.g., open file handles, certain C extensions).
@@ -2,180 +2,333 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import os
-from typing import Optional, Sequence
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence, overload
 from datastructures.ilinkedlist import ILinkedList, T
 
+# Type-check policy for new lists (and the Deque and ListStack built on them) when none is passed:
+#   'always' checks every item against data_type, 'debug' only while assertions are on (not under python -O),
+#   'never' trusts the caller. Set it to 'debug' to keep the checks in tests and drop them from optimized runs.
+DEFAULT_CHECK_TYPES = 'always'
+CHECK_TYPES_POLICIES = ('always', 'debug', 'never')
+
+
+def _resolve_check_types(check_types: Optional[str]) -> tuple[str, bool]:
+    # The policy a list constructor was given (DEFAULT_CHECK_TYPES when None) and whether items get checked under it
+    policy = DEFAULT_CHECK_TYPES if check_types is None else check_types
+    if policy not in CHECK_TYPES_POLICIES:
+        raise ValueError(f"check_types must be one of {', '.join(CHECK_TYPES_POLICIES)}")
+    return policy, policy == 'always' or (policy == 'debug' and __debug__)
+
 
 class LinkedList[T](ILinkedList[T]):
 
-    @dataclass
+    # slots=True drops the per-node __dict__, and eq=False keeps node comparisons by identity
+    @dataclass(slots=True, eq=False)
     class Node:
         data: T
         next: Optional[LinkedList.Node] = None
         previous: Optional[LinkedList.Node] = None
 
-    def __init__(self, data_type: type = object) -> None:
+    class Cursor:
+        # A position in the list that can edit around itself in O(1) while walking forward, e.g. a filter-in-place:
+        #     cursor = linked_list.cursor()
+        #     while cursor:
+        #         if should_drop(cursor.value): cursor.remove()
+        #         else: cursor.advance()
+        __slots__ = ('_list', '_node')
+
+        def __init__(self, linked_list: LinkedList[T]) -> None:
+            self._list = linked_list
+            self._node: Optional[LinkedList.Node] = linked_list.head
+
+        def __bool__(self) -> bool:
+            # False once the cursor has walked off the end
+            return self._node is not None
+
+        @property
+        def node(self) -> LinkedList.Node:
+            return self._current()
+
+        @property
+        def value(self) -> T:
+            return self._current().data
+
+        @value.setter
+        def value(self, item: T) -> None:
+            if self._list._type_checked and not isinstance(item, self._list.data_type):
+                raise TypeError(f"Item must be of type {self._list.data_type.__name__}")
+            self._list._set_data(self._current(), item)
+
+        def advance(self) -> None:
+            self._node = self._current().next
+
+        def remove(self) -> T:
+            # Remove the current item and move on to the one after it
+            node = self._current()
+            self._node = node.next
+            return self._list.remove_node(node)
+
+        def insert_before(self, item: T) -> None:
+            # The new item is behind the cursor, so the walk won't visit it
+            self._list.insert_before_node(self._current(), item)
+
+        def insert_after(self, item: T) -> None:
+            # The new item is next in line for the walk
+            self._list.insert_after_node(self._current(), item)
+
+        def _current(self) -> LinkedList.Node:
+            if self._node is None:
+                raise IndexError("Cursor is past the end of the linked list")
+            return self._node
+
+    class View:
+        # A live view over the list's nodes read in one direction, made in O(1). With reverse=True the tail is the
+        # front and `previous` leads forward, so back-to-front algorithms need no copy, e.g. a palindrome check:
+        #     linked_list == linked_list.reversed_view()
+        # Edits through the view or the list show up in both.
+        __slots__ = ('_list', '_reverse')
+
+        def __init__(self, linked_list: LinkedList[T], reverse: bool = False) -> None:
+            self._list = linked_list
+            self._reverse = reverse
+
+        @property
+        def reverse(self) -> bool:
+            return self._reverse
+
+        def reversed_view(self) -> LinkedList.View:
+            return LinkedList.View(self._list, not self._reverse)
+
+        def append(self, item: T) -> LinkedList.Node:
+            return self._list.prepend(item) if self._reverse else self._list.append(item)
+
+        def prepend(self, item: T) -> LinkedList.Node:
+            return self._list.append(item) if self._reverse else self._list.prepend(item)
+
+        def pop(self) -> T:
+            return self._list.pop_front() if self._reverse else self._list.pop()
+
+        def pop_front(self) -> T:
+            return self._list.pop() if self._reverse else self._list.pop_front()
+
+        @property
+        def front(self) -> T:
+            return self._list.back if self._reverse else self._list.front
+
+        @property
+        def back(self) -> T:
+            return self._list.front if self._reverse else self._list.back
+
+        @property
+        def empty(self) -> bool:
+            return self._list.empty
+
+        def __len__(self) -> int:
+            return len(self._list)
+
+        def __getitem__(self, index: int) -> T:
+            if self._reverse:
+                index = -1 - index
+            return self._list._node_at(index).data
+
+        def __contains__(self, item: T) -> bool:
+            return item in self._list
+
+        def __iter__(self) -> Iterator[T]:
+            return reversed(self._list) if self._reverse else iter(self._list)
+
+        def __reversed__(self) -> Iterator[T]:
+            return iter(self._list) if self._reverse else reversed(self._list)
+
+        def __eq__(self, other: object) -> bool:
+            if not isinstance(other, (LinkedList, LinkedList.View)):
+                return False
+            if len(self) != len(other):
+                return False
+            return all(mine == theirs for mine, theirs in zip(self, other))
+
+        def __str__(self) -> str:
+            return '[' + ', '.join(repr(item) for item in self) + ']'
+
+        def __repr__(self) -> str:
+            return f"LinkedList.View({' <-> '.join(repr(item) for item in self)}) Count: {len(self)}, reverse: {self._reverse}"
+
+    def __init__(self, data_type: type = object, indexed: bool = False, check_types: Optional[str] = None) -> None:
         self.head: Optional[LinkedList.Node] = None
         self.tail: Optional[LinkedList.Node] = None
         self.count: int = 0
         self.data_type = data_type
+        self.check_types, self._type_checked = _resolve_check_types(check_types)
+        # Finger: the node found by the last positional access and its index, so nearby lookups don't start over
+        self._finger: Optional[LinkedList.Node] = None
+        self._finger_index: int = 0
+        # Value index (opt-in): maps each value to the set of nodes holding it, so `in`, remove and remove_all
+        # don't scan the list. Items must be hashable, and every link/unlink keeps the index in step
+        self._index: Optional[dict[Any, set[LinkedList.Node]]] = {} if indexed else None
 
     @staticmethod
-    def from_sequence(sequence: Sequence[T], data_type: type=object) -> LinkedList[T]:
-        linked_list:LinkedList[T] = LinkedList(data_type=data_type)
-
-        for item in sequence:
-            linked_list.append(item)
+    def from_sequence(sequence: Sequence[T], data_type: type=object, indexed: bool = False, check_types: Optional[str] = None) -> LinkedList[T]:
+        linked_list:LinkedList[T] = LinkedList(data_type=data_type, indexed=indexed, check_types=check_types)
+        linked_list.extend(sequence)
         return linked_list
-    
-    def append(self, item: T) -> None:
-        if not isinstance(item, self.data_type):
-            raise TypeError(f"Item must be of type {self.data_type.__name__}")
 
-        new_node:LinkedList.Node = LinkedList.Node(data=item)
-
-        if self.empty:
-            self.head = self.tail = new_node
-        else: 
-            if self.tail:
-                self.tail.next = new_node
-                new_node.previous = self.tail
-                self.tail = new_node
+    @staticmethod
+    def concat(lists: Iterable[LinkedList[T]], data_type: type=object) -> LinkedList[T]:
+        # Join lists into a new one by relinking their nodes, O(1) per list. The lists passed in are left empty
+        linked_list: LinkedList[T] = LinkedList(data_type=data_type)
+        for other in lists:
+            linked_list.splice(other)
+        return linked_list
 
-        self.count += 1
+    def extend(self, items: Iterable[T]) -> None:
+        # Append every item. All items are type-checked before any is linked, so a bad item leaves the list unchanged
+        items = list(items)
+        if self._type_checked and not all(isinstance(item, self.data_type) for item in items):
+            raise TypeError(f"Item must be of type {self.data_type.__name__}")
+        self._check_hashable(items)
+
+        for item in items:
+            self._link_after(self.tail, LinkedList.Node(data=item))
+
+    def splice(self, other: LinkedList[T], after: Optional[LinkedList.Node] = None) -> None:
+        # Move all of other's nodes into this list after the node `after` (at the end when None), in O(1).
+        # other is left empty and any node handles from it now belong to this list
+        if other is self:
+            raise ValueError("Cannot splice a linked list into itself")
+        if not issubclass(other.data_type, self.data_type):
+            raise TypeError(f"Items must be of type {self.data_type.__name__}")
+        if after is not None:
+            self._check_node(after)
+        if other.empty:
+            return
+        self._check_hashable(other)
+
+        first, last, moved = other.head, other.tail, other.count
+        other.clear()
+        anchor = self.tail if after is None else after
+        if anchor is not self.tail:
+            self._finger = None
+        if anchor is None:
+            self.head, self.tail = first, last
+        else:
+            last.next = anchor.next
+            if anchor.next:
+                anchor.next.previous = last
+            else:
+                self.tail = last
+            anchor.next = first
+            first.previous = anchor
+        self.count += moved
+        if self._index is not None:
+            # Indexing the moved nodes makes splice O(m) for an indexed list
+            current = first
+            while current is not last.next:
+                self._index_add(current)
+                current = current.next
 
-    def prepend(self, item: T) -> None:
-        if not isinstance(item, self.data_type):
+    def split_at(self, node: LinkedList.Node) -> LinkedList[T]:
+        # Cut the list right after node and return everything that followed as a new list.
+        # Relinking is O(1); counting the moved part is O(length of that part)
+        self._check_node(node)
+        rest: LinkedList[T] = LinkedList(data_type=self.data_type, indexed=self._index is not None, check_types=self.check_types)
+        if node is self.tail:
+            return rest
+
+        rest.head, rest.tail = node.next, self.tail
+        rest.head.previous = None
+        node.next = None
+        self.tail = node
+        current = rest.head
+        while current:
+            rest.count += 1
+            if self._index is not None:
+                self._index_discard(current)
+                rest._index_add(current)
+            current = current.next
+        self.count -= rest.count
+        self._finger = None
+        return rest
+    
+    def append(self, item: T) -> LinkedList.Node:
+        if self._type_checked and not isinstance(item, self.data_type):
             raise TypeError(f"Item must be of type {self.data_type.__name__}")
 
         new_node: LinkedList.Node = LinkedList.Node(data=item)
+        self._link_after(self.tail, new_node)
+        return new_node
 
-        if self.empty:
-            self.head = self.tail = new_node
-        else:
-            new_node.next = self.head
-            self.head.previous = new_node
-            self.head = new_node
+    def prepend(self, item: T) -> LinkedList.Node:
+        if self._type_checked and not isinstance(item, self.data_type):
+            raise TypeError(f"Item must be of type {self.data_type.__name__}")
 
-        self.count += 1
+        new_node: LinkedList.Node = LinkedList.Node(data=item)
+        self._link_before(self.head, new_node)
+        return new_node
 
     def insert_before(self, target: T, item: T) -> None:
-        if not isinstance(item, self.data_type):
+        if self._type_checked and not isinstance(item, self.data_type):
             raise TypeError(f"Item must be of type {self.data_type.__name__}")
-        if not isinstance(target, self.data_type):
+        if self._type_checked and not isinstance(target, self.data_type):
             raise TypeError(f"Target must be of type {self.data_type.__name__}")
 
-
-        current = self.head
-        while current:
-            if current.data == target:
-                new_node = LinkedList.Node(data=item)
-                new_node.next = current
-                new_node.previous = current.previous
-
-                if current.previous:
-                    current.previous.next = new_node
-                else:
-                    self.head = new_node
-
-                current.previous = new_node
-                self.count += 1
-                return
-
-            current = current.next
+        current = self._find(target)
+        if current:
+            self._link_before(current, LinkedList.Node(data=item))
+            return
 
         raise ValueError(f"The target item {target} is not in the linked list.")
 
     def insert_after(self, target: T, item: T) -> None:
-        if not isinstance(item, self.data_type):
+        if self._type_checked and not isinstance(item, self.data_type):
             raise TypeError(f"Item must be of type {self.data_type.__name__}")
-        if not isinstance(target, self.data_type):
+        if self._type_checked and not isinstance(target, self.data_type):
             raise TypeError(f"Target must be of type {self.data_type.__name__}")
 
-        current = self.head
-        while current:
-            if current.data == target:
-                new_node = LinkedList.Node(data=item)
-                new_node.previous = current
-                new_node.next = current.next
-
-                if current.next:
-                    current.next.previous = new_node
-                else:
-                    self.tail = new_node
+        current = self._find(target)
+        if current:
+            self._link_after(current, LinkedList.Node(data=item))
+            return
 
-                current.next = new_node
-                self.count += 1
-                break
+        raise ValueError(f"The target item {target} is not in the linked list.")
 
-            current = current.next
-        else:
-            raise ValueError(f"The target item {target} is not in the linked list.")
     def remove(self, item: T) -> None:
-        if not isinstance(item, self.data_type):
+        if self._type_checked and not isinstance(item, self.data_type):
             raise TypeError(f"Item must be of type {self.data_type.__name__}")
 
-        current = self.head
-        while current:
-            if current.data == item:
-                # Update pointers to remove the node
-                if current.previous:
-                    current.previous.next = current.next
-                else:
-                    self.head = current.next  # Update head if removing the first node
-
-                if current.next:
-                    current.next.previous = current.previous
-                else:
-                    self.tail = current.previous  # Update tail if removing the last node
-
-                self.count -= 1
-                return
-
-            current = current.next
+        current = self._find(item)
+        if current:
+            self._unlink(current)
+            return
 
         raise ValueError(f"The item {item} is not in the linked list.")
 
     def remove_all(self, item: T) -> None:
-        if not isinstance(item, self.data_type):
+        if self._type_checked and not isinstance(item, self.data_type):
             raise TypeError(f"Item must be of type {self.data_type.__name__}")
 
+        if self._index is not None:
+            try:
+                nodes = list(self._index.get(item, ()))
+            except TypeError:
+                return  # unhashable, so it can't be in an indexed list
+            for node in nodes:
+                self._unlink(node)
+            return
+
         current = self.head
         while current:
+            # Remember the next node before unlinking clears it
+            next_node = current.next
             if current.data == item:
-                if current.previous:
-                    current.previous.next = current.next
-                else:
-                    self.head = current.next  # Update head if removing the first node
+                self._unlink(current)
+            current = next_node
 
-                if current.next:
-                    current.next.previous = current.previous
-                else:
-                    self.tail = current.previous  # Update tail if removing the last node
-
-                self.count -= 1
-
-                # Move to the next node after removal
-                current = current.next
-            else:
-                # Move to the next node if no removal
-                current = current.next
-        
     def pop(self) -> T:
         if self.empty:
             raise IndexError("LinkedList is empty")
 
         data = self.tail.data  # Get the data of the last node
-
-        if self.head == self.tail:
-            # If there's only one node, clear the list
-            self.head = self.tail = None
-        else:
-            # Update the tail to the previous node
-            self.tail = self.tail.previous
-            self.tail.next = None
-
-        self.count -= 1
+        self._unlink(self.tail)
         return data
 
     def pop_front(self) -> T:
@@ -183,17 +336,331 @@ class LinkedList[T](ILinkedList[T]):
             raise IndexError("LinkedList is empty")
 
         data = self.head.data  # Get the data of the first node
+        self._unlink(self.head)
+        return data
+
+    def sort(self, key: Optional[Callable[[T], Any]] = None, reverse: bool = False) -> None:
+        # Stable sort that relinks the existing nodes (handles stay valid): O(n log n) time, O(n) extra memory.
+        # Each key is computed once, and nothing is relinked until every comparison has succeeded, so a key or
+        # comparison that raises leaves the list as it was
+        if self.count < 2:
+            return
+        decorated = self._decorate(self.head, key)
+        decorated.sort(key=lambda pair: pair[0], reverse=reverse)
+        self._relink([node for _, node in decorated])
+
+    def merge_sorted(self, other: LinkedList[T], key: Optional[Callable[[T], Any]] = None, reverse: bool = False) -> None:
+        # Merge another list that is sorted the same way into this sorted list in O(n + m), relinking nodes.
+        # On ties this list's items come first. other is left empty; if a key or comparison raises, neither list changes
+        if other is self:
+            raise ValueError("Cannot merge a linked list with itself")
+        if not issubclass(other.data_type, self.data_type):
+            raise TypeError(f"Items must be of type {self.data_type.__name__}")
+        self._check_hashable(other)
+
+        mine, theirs = self._decorate(self.head, key), self._decorate(other.head, key)
+        merged: list[LinkedList.Node] = []
+        i = j = 0
+        while i < len(mine) and j < len(theirs):
+            # Take theirs only when it must strictly precede mine, which keeps this list's items first on ties
+            if (mine[i][0] < theirs[j][0]) if reverse else (theirs[j][0] < mine[i][0]):
+                merged.append(theirs[j][1])
+                j += 1
+            else:
+                merged.append(mine[i][1])
+                i += 1
+        merged.extend(node for _, node in mine[i:])
+        merged.extend(node for _, node in theirs[j:])
+
+        other.clear()
+        if self._index is not None:
+            for _, node in theirs:
+                self._index_add(node)
+        self.count += len(theirs)
+        self._relink(merged)
+
+    def reverse(self) -> None:
+        # Reverse the list in place by swapping every node's next and previous pointers, O(n) and no allocation.
+        # Node handles stay valid. For an O(1) back-to-front reading without changing the list, use reversed_view()
+        current = self.head
+        while current:
+            current.next, current.previous = current.previous, current.next
+            current = current.previous
+        self.head, self.tail = self.tail, self.head
+        self._finger_index = self.count - 1 - self._finger_index
+
+    def reversed_view(self) -> LinkedList.View:
+        return LinkedList.View(self, reverse=True)
+
+    @staticmethod
+    def _decorate(head: Optional[LinkedList.Node], key: Optional[Callable[[T], Any]]) -> list[tuple[Any, LinkedList.Node]]:
+        # (key, node) for every node from head on, calling key once per node
+        pairs = []
+        current = head
+        while current:
+            pairs.append((current.data if key is None else key(current.data), current))
+            current = current.next
+        return pairs
+
+    def _relink(self, nodes: list[LinkedList.Node]) -> None:
+        # Chain nodes in the given order and rebuild head and tail
+        previous = None
+        for node in nodes:
+            node.previous = previous
+            if previous:
+                previous.next = node
+            previous = node
+        if previous:
+            previous.next = None
+        self.head = nodes[0] if nodes else None
+        self.tail = previous
+        self._finger = None
+
+    # Node handles: append and prepend return the node they create, and these O(1) operations accept it back.
+    # A handle stays valid until its node is removed; handles from other lists must not be passed in.
+
+    def nodes(self) -> Iterator[LinkedList.Node]:
+        current = self.head
+        while current:
+            # Read next first so the caller may remove the node it was handed
+            next_node = current.next
+            yield current
+            current = next_node
+
+    def remove_node(self, node: LinkedList.Node) -> T:
+        self._check_node(node)
+        self._unlink(node)
+        return node.data
+
+    def insert_after_node(self, node: LinkedList.Node, item: T) -> LinkedList.Node:
+        if self._type_checked and not isinstance(item, self.data_type):
+            raise TypeError(f"Item must be of type {self.data_type.__name__}")
+        self._check_node(node)
+
+        new_node: LinkedList.Node = LinkedList.Node(data=item)
+        self._link_after(node, new_node)
+        return new_node
+
+    def insert_before_node(self, node: LinkedList.Node, item: T) -> LinkedList.Node:
+        if self._type_checked and not isinstance(item, self.data_type):
+            raise TypeError(f"Item must be of type {self.data_type.__name__}")
+        self._check_node(node)
+
+        new_node: LinkedList.Node = LinkedList.Node(data=item)
+        self._link_before(node, new_node)
+        return new_node
+
+    def move_to_front(self, node: LinkedList.Node) -> None:
+        self._check_node(node)
+        if node is not self.head:
+            self._unlink(node)
+            self._link_before(self.head, node)
+
+    def move_to_back(self, node: LinkedList.Node) -> None:
+        self._check_node(node)
+        if node is not self.tail:
+            self._unlink(node)
+            self._link_after(self.tail, node)
+
+    def _check_node(self, node: LinkedList.Node) -> None:
+        # A node without a neighbor on one side must be the head or tail; this catches removed nodes
+        # and the ends of other lists in O(1)
+        if (node.previous is None and node is not self.head) or (node.next is None and node is not self.tail):
+            raise ValueError("The node is not in the linked list.")
+
+    def _link_after(self, anchor: Optional[LinkedList.Node], new_node: LinkedList.Node) -> None:
+        # Link new_node right after anchor, or as the only node when anchor is None (empty list).
+        # The node is indexed first, so an unhashable item raises before the list changes
+        if self._index is not None:
+            self._index_add(new_node)
+        if anchor is not self.tail:
+            self._finger = None  # nodes after anchor shift by one, and the finger may be among them
+        if anchor is None:
+            self.head = self.tail = new_node
+        else:
+            new_node.previous = anchor
+            new_node.next = anchor.next
+            if anchor.next:
+                anchor.next.previous = new_node
+            else:
+                self.tail = new_node
+            anchor.next = new_node
+        self.count += 1
+
+    def _link_before(self, anchor: Optional[LinkedList.Node], new_node: LinkedList.Node) -> None:
+        # Link new_node right before anchor, or as the only node when anchor is None (empty list)
+        if self._index is not None:
+            self._index_add(new_node)
+        if anchor is self.head or anchor is self._finger:
+            self._finger_index += 1  # the finger is at or after anchor, so it moves down by one
+        else:
+            self._finger = None
+        if anchor is None:
+            self.head = self.tail = new_node
+        else:
+            new_node.next = anchor
+            new_node.previous = anchor.previous
+            if anchor.previous:
+                anchor.previous.next = new_node
+            else:
+                self.head = new_node
+            anchor.previous = new_node
+        self.count += 1
 
-        if self.head == self.tail:
-            # If there's only one node, clear the list
-            self.head = self.tail = None
+    def _unlink(self, node: LinkedList.Node) -> None:
+        # Update pointers to remove the node
+        if node is self._finger:
+            self._finger = None
+        elif node is self.head:
+            self._finger_index -= 1
+        elif node is not self.tail:
+            self._finger = None
+        if node.previous:
+            node.previous.next = node.next
         else:
-            # Update the head to the next node
-            self.head = self.head.next
-            self.head.previous = None
+            self.head = node.next  # Update head if removing the first node
 
+        if node.next:
+            node.next.previous = node.previous
+        else:
+            self.tail = node.previous  # Update tail if removing the last node
+
+        node.next = node.previous = None
         self.count -= 1
-        return data
+        if self._index is not None:
+            self._index_discard(node)
+
+    def _index_add(self, node: LinkedList.Node) -> None:
+        self._index.setdefault(node.data, set()).add(node)
+
+    def _index_discard(self, node: LinkedList.Node) -> None:
+        nodes = self._index[node.data]
+        nodes.discard(node)
+        if not nodes:
+            del self._index[node.data]
+
+    def _check_hashable(self, items: Iterable[T]) -> None:
+        # An indexed list hashes every item it links; check a whole batch up front so a bad item changes nothing
+        if self._index is not None:
+            for item in items:
+                hash(item)
+
+    def _set_data(self, node: LinkedList.Node, item: T) -> None:
+        # Replace a node's value, moving the node to the right index entry
+        if self._index is not None:
+            hash(item)  # raise for an unhashable item before the node leaves the index
+            self._index_discard(node)
+            node.data = item
+            self._index_add(node)
+        else:
+            node.data = item
+
+    def _find(self, item: T) -> Optional[LinkedList.Node]:
+        # First node holding item, or None. With the index this is O(1) when the value occurs once;
+        # with duplicates it walks from the head only as far as the first of them
+        if self._index is None:
+            current = self.head
+            while current:
+                if current.data == item:
+                    return current
+                current = current.next
+            return None
+
+        try:
+            nodes = self._index.get(item)
+        except TypeError:
+            return None  # unhashable, so it can't be in an indexed list
+        if not nodes:
+            return None
+        if len(nodes) == 1:
+            return next(iter(nodes))
+        current = self.head
+        while current not in nodes:
+            current = current.next
+        return current
+
+    # Positional access. Lookups walk from whichever is closest of the head, the tail and the finger left by
+    # the previous lookup, so sequential patterns (i, i + 1, ...) are O(1) and others at most O(n / 2).
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+    @overload
+    def __getitem__(self, index: slice) -> LinkedList[T]: ...
+    def __getitem__(self, index: int | slice) -> T | LinkedList[T]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.count)
+            if step != 1:
+                linked_list: LinkedList[T] = LinkedList(data_type=self.data_type)
+                for position in range(start, stop, step):
+                    linked_list.append(self._node_at(position).data)
+                return linked_list
+            return self.slice(start, stop)
+        return self._node_at(index).data
+
+    def __setitem__(self, index: int, item: T) -> None:
+        if self._type_checked and not isinstance(item, self.data_type):
+            raise TypeError(f"Item must be of type {self.data_type.__name__}")
+        self._set_data(self._node_at(index), item)
+
+    def insert_at(self, index: int, item: T) -> LinkedList.Node:
+        # Insert so that item ends up at index; index == len(self) appends
+        if self._type_checked and not isinstance(item, self.data_type):
+            raise TypeError(f"Item must be of type {self.data_type.__name__}")
+        if index < 0:
+            index += self.count
+        if index < 0 or index > self.count:
+            raise IndexError("Index is out of range")
+
+        new_node: LinkedList.Node = LinkedList.Node(data=item)
+        if index == self.count:
+            self._link_after(self.tail, new_node)
+        else:
+            self._link_before(self._node_at(index), new_node)
+        self._finger, self._finger_index = new_node, index
+        return new_node
+
+    def delete_at(self, index: int) -> T:
+        node = self._node_at(index)
+        index = self._finger_index
+        following = node.next
+        self._unlink(node)
+        if following is not None:
+            self._finger, self._finger_index = following, index
+        return node.data
+
+    def slice(self, start: int, stop: int) -> LinkedList[T]:
+        # Copy the items in [start, stop) into a new LinkedList, walking only from start
+        bounds = range(self.count)[start:stop]
+        start, stop = bounds.start, bounds.stop
+        linked_list: LinkedList[T] = LinkedList(data_type=self.data_type)
+        if start >= stop:
+            return linked_list
+        current = self._node_at(start)
+        for _ in range(stop - start):
+            linked_list.append(current.data)
+            current = current.next
+        return linked_list
+
+    def _node_at(self, index: int) -> LinkedList.Node:
+        if index < 0:
+            index += self.count
+        if index < 0 or index >= self.count:
+            raise IndexError("Index is out of range")
+
+        # Start from the closest known position
+        current, position = self.head, 0
+        if self.count - 1 - index < index:
+            current, position = self.tail, self.count - 1
+        if self._finger is not None and abs(self._finger_index - index) < abs(position - index):
+            current, position = self._finger, self._finger_index
+
+        while position < index:
+            current, position = current.next, position + 1
+        while position > index:
+            current, position = current.previous, position - 1
+
+        self._finger, self._finger_index = current, index
+        return current
 
     @property
     def front(self) -> T:
@@ -217,34 +684,44 @@ class LinkedList[T](ILinkedList[T]):
         self.head = None
         self.tail = None
         self.count = 0
+        self._finger = None
+        if self._index is not None:
+            self._index = {}
 
     def __contains__(self, item: T) -> bool:
-        current = self.head
-        while current:
-            if current.data == item:
-                return True
-            current = current.next
-        return False
+        return self._find(item) is not None
 
-    def __iter__(self) -> ILinkedList[T]:
-        self._current = self.head  # Start iteration from the head
-        return self
+    @property
+    def indexed(self) -> bool:
+        return self._index is not None
+
+    def __iter__(self) -> Iterator[T]:
+        # Every call makes an independent generator, so nested and concurrent loops over the same list don't interfere
+        current = self.head  # Start iteration from the head
+        while current:
+            # Read next first: unlinking clears it, and the loop body may remove the item it was handed
+            next_node = current.next
+            yield current.data
+            current = next_node  # Move to the next node
 
     def __next__(self) -> T:
-        if self._current is None:
-            raise StopIteration  # End of the linked list
+        # Required by ILinkedList, but the list keeps no iteration state of its own; iter() hands out the iterators
+        raise TypeError("LinkedList is not an iterator; call iter() on it first")
 
-        data = self._current.data  # Get the current node's data
-        self._current = self._current.next  # Move to the next node
-        return data
+    def cursor(self) -> LinkedList.Cursor:
+        return LinkedList.Cursor(self)
     
-    def __reversed__(self):
+    def __reversed__(self) -> Iterator[T]:
+        # Streams from the tail without copying; reversed_view() gives the same order with the rest of the list API
         current = self.tail  # Start from the tail
         while current:
+            previous_node = current.previous  # Read before yielding, as __iter__ does with next
             yield current.data  # Yield the data of the current node
-            current = current.previous  # Move to the previous node
+            current = previous_node  # Move to the previous node
         
     def __eq__(self, other: object) -> bool:
+        if isinstance(other, LinkedList.View):
+            return other == self
         if not isinstance(other, LinkedList):
             return False
         if len(self) != len(other):
@@ -1,8 +1,10 @@
 import os
 from datastructures.istack import IStack
-from typing import Generic
+from typing import Generic, Iterator, Optional
 
+from datastructures.ilinkedlist import ILinkedList
 from datastructures.linkedlist import LinkedList
+from datastructures.singlylinkedlist import SinglyLinkedList
 
 class ListStack[T](IStack[T]):
     """
@@ -10,16 +12,28 @@ class ListStack[T](IStack[T]):
 
     """
 
-    def __init__(self, data_type:object) -> None:
+    def __init__(self, data_type:object, indexed: bool = False, check_types: Optional[str] = None, list_type: type[ILinkedList] = LinkedList) -> None:
         """
         Initializes the ListStack.
 
         Args:
             data_type (type): The type of data the stack will hold.
+            indexed (bool): Keep a value index so `in` is O(1). Items must be hashable.
+            check_types (str | None): 'always', 'debug' or 'never' type-check pushed items
+                (see linkedlist.DEFAULT_CHECK_TYPES, which applies when None).
+            list_type (type[ILinkedList]): The linked list class that stores the items. SinglyLinkedList
+                saves a pointer per item; the top of the stack is then kept at the front of the list.
 
         """
         self.__data_type = data_type
-        self.__list = LinkedList(data_type)
+        options = {}
+        if indexed:
+            options['indexed'] = True
+        if check_types is not None:
+            options['check_types'] = check_types
+        self.__list = list_type(data_type, **options)
+        # A singly linked list can only pop its front in O(1), so that end becomes the top
+        self.__top_at_front = issubclass(list_type, SinglyLinkedList)
 
     def push(self, item: T):
         """
@@ -32,7 +46,10 @@ class ListStack[T](IStack[T]):
             TypeError: If the item is not of the correct type.
 
         """
-        self.__list.append(item)
+        if self.__top_at_front:
+            self.__list.prepend(item)
+        else:
+            self.__list.append(item)
 
     def pop(self) -> T:
         """
@@ -44,6 +61,8 @@ class ListStack[T](IStack[T]):
         Raises:
             IndexError: If the stack is empty.
         """
+        if self.__top_at_front:
+            return self.__list.pop_front()
         return self.__list.pop()
 
     def peek(self) -> T:
@@ -58,7 +77,7 @@ class ListStack[T](IStack[T]):
         """
         if self.empty:
             raise IndexError("LinkedList is empty")
-        return self.__list.back
+        return self.__list.front if self.__top_at_front else self.__list.back
 
     @property
     def empty(self) -> bool:
@@ -100,7 +119,10 @@ class ListStack[T](IStack[T]):
             bool: True if the stacks are equal, False otherwise.
 
         """
-        return self.__list == other.__list
+        # Compare bottom to top, so stacks backed by different list types compare by content
+        if not isinstance(other, ListStack) or len(self) != len(other):
+            return False
+        return all(mine == theirs for mine, theirs in zip(self.__bottom_to_top(), other.__bottom_to_top()))
 
     def __len__(self) -> int:
         """
@@ -116,9 +138,9 @@ class ListStack[T](IStack[T]):
         Returns a string representation of the stack.
 
         Returns:
-            str: A string representation of the stack.
+            str: A string representation of the stack, from the bottom item to the top one.
         """
-        return str(self.__list)
+        return '[' + ', '.join(repr(item) for item in self.__bottom_to_top()) + ']'
 
     def __repr__(self) -> str:
         """
@@ -128,7 +150,14 @@ class ListStack[T](IStack[T]):
             str: A detailed string representation of the stack.
 
         """
-        return repr(self.__list)
+        if not self.__top_at_front:
+            return repr(self.__list)
+        items = ' -> '.join(repr(item) for item in self.__bottom_to_top())
+        return f"{type(self.__list).__name__}({items}) Count: {len(self)}"
+
+    def __bottom_to_top(self) -> Iterator[T]:
+        # The stack's items in push order, whichever end of the backing list holds the top
+        return reversed(self.__list) if self.__top_at_front else iter(self.__list)
     
 
 if __name__ == '__main__':
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import os
+from typing import Any, Callable, Iterator, Mapping, Optional, Tuple
+import numpy as np
+
+from datastructures.hashmap import build_hash_function
+from datastructures.ihashmap import KT, VT, IHashMap
+
+
+class OpenHashMap(IHashMap[KT, VT]):
+    """
+    A hash map that uses open addressing (linear probing) over four parallel NumPy arrays:
+    slot states, cached hashes, keys and values. There are no bucket chains, so an entry costs
+    one slot in each array instead of a linked-list node plus an entry object, and a lookup walks
+    adjacent slots instead of chasing pointers.
+
+    Deleting leaves a tombstone so later probes keep going past it. Inserts reuse tombstones, and
+    the table is compacted (rebuilt in place from the cached hashes, no key is hashed again) once
+    they take up a quarter of it. The table doubles when live entries plus tombstones exceed the load factor.
+    """
+
+    _EMPTY, _FULL, _DELETED = 0, 1, 2
+    _HASH_MASK = (1 << 63) - 1          # hashes are stored as non-negative int64
+    _FIBONACCI = 0x9E3779B97F4A7C15     # 2**64 / golden ratio: spreads clustered hashes over the table
+    MIN_CAPACITY = 8
+
+    def __init__(self, initial_capacity: int = 8, load_factor: float = 0.7, custom_hash_function: Optional[Callable[[KT], int]] = None,
+                 hash_strategy: str = 'builtin', type_hashers: Optional[Mapping[type, Callable[[Any], int]]] = None) -> None:
+        if not 0 < load_factor < 1:
+            raise ValueError("load_factor must be between 0 and 1 for open addressing")
+        self._load_factor: float = load_factor
+        self._hash_function = build_hash_function(custom_hash_function, hash_strategy, type_hashers)
+        self._count: int = 0
+        self._deleted: int = 0
+        capacity = OpenHashMap.MIN_CAPACITY
+        while capacity < initial_capacity:
+            capacity *= 2
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        # capacity is a power of two, so the home slot is the top bits of the mixed hash
+        self._states = np.zeros(capacity, dtype=np.uint8)
+        self._hashes = np.zeros(capacity, dtype=np.int64)
+        self._keys = np.empty(capacity, dtype=object)
+        self._values = np.empty(capacity, dtype=object)
+        self._mask = capacity - 1
+        self._shift = 64 - (capacity.bit_length() - 1)
+
+    def _hash(self, key: KT) -> int:
+        return self._hash_function(key) & OpenHashMap._HASH_MASK
+
+    def _home(self, key_hash: int) -> int:
+        return ((key_hash * OpenHashMap._FIBONACCI) & 0xFFFFFFFFFFFFFFFF) >> self._shift
+
+    def _find(self, key: KT, key_hash: int) -> int:
+        # Slot holding key, or -1. The probe stops at the first empty slot; tombstones are stepped over
+        states, hashes, keys, mask = self._states, self._hashes, self._keys, self._mask
+        slot = self._home(key_hash)
+        while True:
+            state = states[slot]
+            if state == OpenHashMap._EMPTY:
+                return -1
+            if state == OpenHashMap._FULL and hashes[slot] == key_hash:
+                existing = keys[slot]
+                if existing is key or existing == key:
+                    return slot
+            slot = (slot + 1) & mask
+
+    def _rebuild(self, capacity: int) -> None:
+        # Reinsert every live entry into fresh arrays by its cached hash. This drops all tombstones
+        live = np.flatnonzero(self._states == OpenHashMap._FULL)
+        hashes, keys, values = self._hashes[live].tolist(), self._keys[live], self._values[live]
+        self._allocate(capacity)
+        states, mask = self._states, self._mask
+        for key_hash, key, value in zip(hashes, keys, values):
+            slot = self._home(key_hash)
+            while states[slot] != OpenHashMap._EMPTY:
+                slot = (slot + 1) & mask
+            states[slot] = OpenHashMap._FULL
+            self._hashes[slot] = key_hash
+            self._keys[slot] = key
+            self._values[slot] = value
+        self._deleted = 0
+
+    def __getitem__(self, key: KT) -> VT:
+        slot = self._find(key, self._hash(key))
+        if slot < 0:
+            raise KeyError(f"Key: {key} does not exist in the OpenHashMap")
+        return self._values[slot]
+
+    def __setitem__(self, key: KT, value: VT) -> None:
+        if self._count + self._deleted + 1 > len(self._states) * self._load_factor:
+            # Mostly tombstones: compact at the same size. Mostly live entries: double
+            self._rebuild(len(self._states) if self._deleted > self._count else len(self._states) * 2)
+
+        key_hash = self._hash(key)
+        states, hashes, keys, mask = self._states, self._hashes, self._keys, self._mask
+        slot = self._home(key_hash)
+        free = -1
+        while True:
+            state = states[slot]
+            if state == OpenHashMap._EMPTY:
+                break
+            if state == OpenHashMap._DELETED:
+                if free < 0:
+                    free = slot
+            elif hashes[slot] == key_hash:
+                existing = keys[slot]
+                if existing is key or existing == key:
+                    self._values[slot] = value
+                    return
+            slot = (slot + 1) & mask
+
+        if free >= 0:
+            slot = free
+            self._deleted -= 1
+        states[slot] = OpenHashMap._FULL
+        hashes[slot] = key_hash
+        keys[slot] = key
+        self._values[slot] = value
+        self._count += 1
+
+    def __delitem__(self, key: KT) -> None:
+        slot = self._find(key, self._hash(key))
+        if slot < 0:
+            raise KeyError(f"Key: {key} does not exist in the OpenHashMap")
+        self._states[slot] = OpenHashMap._DELETED
+        self._keys[slot] = None
+        self._values[slot] = None
+        self._count -= 1
+        self._deleted += 1
+        if self._deleted > len(self._states) // 4:
+            self._rebuild(len(self._states))
+
+    def __contains__(self, key: KT) -> bool:
+        return self._find(key, self._hash(key)) >= 0
+
+    def keys(self) -> Iterator[KT]:
+        yield from self._keys[self._states == OpenHashMap._FULL].tolist()
+
+    def values(self) -> Iterator[VT]:
+        yield from self._values[self._states == OpenHashMap._FULL].tolist()
+
+    def items(self) -> Iterator[Tuple[KT, VT]]:
+        live = self._states == OpenHashMap._FULL
+        yield from zip(self._keys[live].tolist(), self._values[live].tolist())
+
+    @property
+    def capacity(self) -> int:
+        return len(self._states)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[KT]:
+        return self.keys()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, OpenHashMap):
+            return False
+        if len(self) != len(other):
+            return False
+        for key, value in self.items():
+            if key not in other or other[key] != value:
+                return False
+        return True
+
+    def __str__(self) -> str:
+        return "{" + ", ".join(f"{key}: {value}" for key, value in self.items()) + "}"
+
+    def __repr__(self) -> str:
+        return f"OpenHashMap({str(self)})"
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'OOPS!\nThis is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import os
+from typing import Iterator, Optional, Sequence
+from datastructures.ilinkedlist import ILinkedList, T
+from datastructures import linkedlist
+
+
+class SinglyLinkedList[T](ILinkedList[T]):
+    ''' A linked list whose nodes only point forward, plus a tail pointer.
+        Each node saves the `previous` slot of LinkedList and each push/pop saves the pointer update,
+        which suits stacks (push and pop at the front) and FIFO queues (append, pop_front). Those are O(1);
+        pop and walking backwards (__reversed__) need a pass over the list.
+    '''
+
+    @dataclass(slots=True, eq=False)
+    class Node:
+        data: T
+        next: Optional[SinglyLinkedList.Node] = None
+
+    def __init__(self, data_type: type = object, check_types: Optional[str] = None) -> None:
+        self.head: Optional[SinglyLinkedList.Node] = None
+        self.tail: Optional[SinglyLinkedList.Node] = None
+        self.count: int = 0
+        self.data_type = data_type
+        self.check_types, self._type_checked = linkedlist._resolve_check_types(check_types)
+
+    @staticmethod
+    def from_sequence(sequence: Sequence[T], data_type: type=object, check_types: Optional[str] = None) -> SinglyLinkedList[T]:
+        linked_list: SinglyLinkedList[T] = SinglyLinkedList(data_type=data_type, check_types=check_types)
+
+        for item in sequence:
+            linked_list.append(item)
+        return linked_list
+
+    def append(self, item: T) -> None:
+        if self._type_checked and not isinstance(item, self.data_type):
+            raise TypeError(f"Item must be of type {self.data_type.__name__}")
+
+        self._link_after(self.tail, SinglyLinkedList.Node(data=item))
+
+    def prepend(self, item: T) -> None:
+        if self._type_checked and not isinstance(item, self.data_type):
+            raise TypeError(f"Item must be of type {self.data_type.__name__}")
+
+        self._link_after(None, SinglyLinkedList.Node(data=item))
+
+    def insert_before(self, target: T, item: T) -> None:
+        if self._type_checked and not isinstance(item, self.data_type):
+            raise TypeError(f"Item must be of type {self.data_type.__name__}")
+        if self._type_checked and not isinstance(target, self.data_type):
+            raise TypeError(f"Target must be of type {self.data_type.__name__}")
+
+        previous = None
+        current = self.head
+        while current:
+            if current.data == target:
+                self._link_after(previous, SinglyLinkedList.Node(data=item))
+                return
+            previous, current = current, current.next
+
+        raise ValueError(f"The target item {target} is not in the linked list.")
+
+    def insert_after(self, target: T, item: T) -> None:
+        if self._type_checked and not isinstance(item, self.data_type):
+            raise TypeError(f"Item must be of type {self.data_type.__name__}")
+        if self._type_checked and not isinstance(target, self.data_type):
+            raise TypeError(f"Target must be of type {self.data_type.__name__}")
+
+        current = self.head
+        while current:
+            if current.data == target:
+                self._link_after(current, SinglyLinkedList.Node(data=item))
+                return
+            current = current.next
+
+        raise ValueError(f"The target item {target} is not in the linked list.")
+
+    def remove(self, item: T) -> None:
+        if self._type_checked and not isinstance(item, self.data_type):
+            raise TypeError(f"Item must be of type {self.data_type.__name__}")
+
+        previous = None
+        current = self.head
+        while current:
+            if current.data == item:
+                self._unlink_after(previous)
+                return
+            previous, current = current, current.next
+
+        raise ValueError(f"The item {item} is not in the linked list.")
+
+    def remove_all(self, item: T) -> None:
+        if self._type_checked and not isinstance(item, self.data_type):
+            raise TypeError(f"Item must be of type {self.data_type.__name__}")
+
+        previous = None
+        current = self.head
+        while current:
+            if current.data == item:
+                current = current.next
+                self._unlink_after(previous)
+            else:
+                previous, current = current, current.next
+
+    def pop(self) -> T:
+        # O(n): the node before the tail can only be found by walking from the head
+        if self.empty:
+            raise IndexError("LinkedList is empty")
+
+        previous = None
+        current = self.head
+        while current is not self.tail:
+            previous, current = current, current.next
+        return self._unlink_after(previous)
+
+    def pop_front(self) -> T:
+        if self.empty:
+            raise IndexError("LinkedList is empty")
+
+        return self._unlink_after(None)
+
+    @property
+    def front(self) -> T:
+        if self.empty:
+            raise IndexError("LinkedList is empty")
+        return self.head.data
+
+    @property
+    def back(self) -> T:
+        if self.empty:
+            raise IndexError("LinkedList is empty")
+        return self.tail.data
+
+    @property
+    def empty(self) -> bool:
+        return self.count == 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self) -> None:
+        self.head = None
+        self.tail = None
+        self.count = 0
+
+    def __contains__(self, item: T) -> bool:
+        current = self.head
+        while current:
+            if current.data == item:
+                return True
+            current = current.next
+        return False
+
+    def __iter__(self) -> Iterator[T]:
+        current = self.head
+        while current:
+            # Read next first: unlinking clears it, and the loop body may remove the item it was handed
+            next_node = current.next
+            yield current.data
+            current = next_node
+
+    def __next__(self) -> T:
+        raise TypeError("SinglyLinkedList is not an iterator; call iter() on it first")
+
+    def __reversed__(self) -> Iterator[T]:
+        # There are no backward links, so this copies the items first (O(n) memory)
+        return reversed(list(self))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SinglyLinkedList):
+            return False
+        if len(self) != len(other):
+            return False
+        return all(mine == theirs for mine, theirs in zip(self, other))
+
+    def __str__(self) -> str:
+        return '[' + ', '.join(repr(item) for item in self) + ']'
+
+    def __repr__(self) -> str:
+        return f"SinglyLinkedList({' -> '.join(repr(item) for item in self)}) Count: {self.count}"
+
+    def _link_after(self, anchor: Optional[SinglyLinkedList.Node], new_node: SinglyLinkedList.Node) -> None:
+        # Link new_node right after anchor, or at the head when anchor is None
+        if anchor is None:
+            new_node.next = self.head
+            self.head = new_node
+        else:
+            new_node.next = anchor.next
+            anchor.next = new_node
+        if new_node.next is None:
+            self.tail = new_node
+        self.count += 1
+
+    def _unlink_after(self, previous: Optional[SinglyLinkedList.Node]) -> T:
+        # Unlink the node after previous (the head when previous is None) and return its data
+        node = self.head if previous is None else previous.next
+        if previous is None:
+            self.head = node.next
+        else:
+            previous.next = node.next
+        if node is self.tail:
+            self.tail = previous
+        node.next = None
+        self.count -= 1
+        return node.data
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'OOPS!\nThis is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
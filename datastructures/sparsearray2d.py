@@ -0,0 +1,194 @@
+from __future__ import annotations
+import os
+from typing import Iterator, Optional, Sequence, Tuple
+import numpy as np
+
+from datastructures.array2d import Array2D
+from datastructures.iarray2d import IArray2D, T
+
+class SparseArray2D(IArray2D[T]):
+    """ A two-dimensional array that only stores the cells that differ from a default value
+        (dictionary-of-keys layout). Memory grows with the number of stored cells instead of rows * cols,
+        and getting or setting a cell is an O(1) expected dictionary operation.
+        Cells that were never set all return the same default object, so it should be an immutable value
+        (0, False, '', None, ...) rather than something like a Cell that gets changed in place.
+    """
+
+    class Row(IArray2D.IRow[T]):
+        def __init__(self, row_index: int, array: SparseArray2D, num_columns: int) -> None:
+            # Initialize Row with row_index, the sparse array it belongs to, and the number of columns
+            self.__row_index = row_index
+            self.__array = array
+            self.__num_columns = num_columns
+
+        def __getitem__(self, column_index: int) -> T:
+            # Get the item at the specified column_index in this row
+            if column_index >= self.__num_columns:
+                raise IndexError("Column index out of range")
+            return self.__array.get(self.__row_index, column_index)
+
+        def __setitem__(self, column_index: int, value: T) -> None:
+            # Set the item at the specified column_index in this row
+            if column_index >= self.__num_columns:
+                raise IndexError("Column index out of range")
+            self.__array.set(self.__row_index, column_index, value)
+
+        def __iter__(self) -> Iterator[T]:
+            # Allow iteration over items in this row
+            return (self[i] for i in range(self.__num_columns))
+
+        def __reversed__(self) -> Iterator[T]:
+            # Allow reversed iteration over items in this row
+            return (self[i] for i in range(self.__num_columns - 1, -1, -1))
+
+        def __len__(self) -> int:
+            # Return the number of columns in this row
+            return self.__num_columns
+
+        def __str__(self) -> str:
+            # Return string representation of this row
+            return f"[{', '.join(str(item) for item in self)}]"
+
+        def __repr__(self) -> str:
+            # Return detailed string representation of this row
+            return f"Row {self.__row_index}: {str(self)}"
+
+
+    def __init__(self, starting_sequence: Sequence[Sequence[T]] = [[]], data_type=object, default: Optional[T] = None) -> None:
+        # Validate starting_sequence the same way Array2D does, then keep only the non-default cells
+        try:
+            if not all(isinstance(row, Sequence) and not isinstance(row, str) for row in starting_sequence):
+                raise ValueError("must be a sequence of sequences")
+        except TypeError:
+            raise ValueError("must be a sequence of sequences")
+
+        self.__data_type = type(starting_sequence[0][0]) if data_type == object else data_type
+        self.__rows_len = len(starting_sequence)
+        self.__cols_len = len(starting_sequence[0])
+        self.__default = self.__data_type() if default is None else default
+
+        if not all(len(row) == self.__cols_len and all(isinstance(item, self.__data_type) for item in row) for row in starting_sequence):
+            raise ValueError("All items must be of the same type and all rows must have the same length")
+
+        self.__cells: dict[Tuple[int, int], T] = {}
+        for row_index, row in enumerate(starting_sequence):
+            for column_index, item in enumerate(row):
+                if item != self.__default:
+                    self.__cells[(row_index, column_index)] = item
+
+    @staticmethod
+    def empty(rows: int = 0, cols: int = 0, data_type: type = object, default: Optional[T] = None) -> SparseArray2D:
+        # Create a rows x cols sparse array where every cell holds the default. Costs nothing per cell
+        if rows < 0 or cols < 0:
+            raise ValueError("rows and cols must not be negative")
+        array: SparseArray2D = SparseArray2D.__new__(SparseArray2D)
+        array.__data_type = data_type
+        array.__rows_len = rows
+        array.__cols_len = cols
+        array.__default = data_type() if default is None else default
+        array.__cells = {}
+        return array
+
+    @staticmethod
+    def from_dense(dense: Array2D, default: Optional[T] = None) -> SparseArray2D:
+        # Build a sparse copy of a dense Array2D. Numeric and bool grids find their non-default cells in one NumPy pass
+        values = dense.to_numpy()
+        rows, cols = values.shape
+        array = SparseArray2D.empty(rows, cols, data_type=dense.data_type, default=default)
+        if values.dtype == object:
+            for (row_index, column_index), item in np.ndenumerate(values):
+                if item != array.__default:
+                    array.__cells[(row_index, column_index)] = item
+        else:
+            for row_index, column_index in zip(*np.nonzero(values != array.__default)):
+                array.__cells[(int(row_index), int(column_index))] = values[row_index, column_index].item()
+        return array
+
+    def to_dense(self) -> Array2D:
+        # Build a dense Array2D with the same contents
+        if self.__data_type in (bool, int, float, complex):
+            values = np.full((self.__rows_len, self.__cols_len), self.__default, dtype=self.__data_type)
+            for (row_index, column_index), item in self.__cells.items():
+                values[row_index, column_index] = item
+            return Array2D.from_numpy(values, data_type=self.__data_type)
+        dense = Array2D.empty(self.__rows_len, 0, data_type=self.__data_type)
+        dense.resize(self.__rows_len, self.__cols_len, fill=self.__default)
+        for (row_index, column_index), item in self.__cells.items():
+            dense[row_index][column_index] = item
+        return dense
+
+    def get(self, row_index: int, column_index: int) -> T:
+        # Get a single cell; cells that were never set hold the default
+        self.__check_bounds(row_index, column_index)
+        return self.__cells.get((row_index, column_index), self.__default)
+
+    def set(self, row_index: int, column_index: int, value: T) -> None:
+        # Set a single cell. Writing the default removes the cell from storage
+        self.__check_bounds(row_index, column_index)
+        if not isinstance(value, self.__data_type):
+            raise TypeError(f"Item must be of type {self.__data_type.__name__}")
+        if value == self.__default:
+            self.__cells.pop((row_index, column_index), None)
+        else:
+            self.__cells[(row_index, column_index)] = value
+
+    def nonzero_items(self) -> Iterator[Tuple[Tuple[int, int], T]]:
+        # Yield ((row, column), value) for every stored (non-default) cell, in no particular order
+        return iter(list(self.__cells.items()))
+
+    @property
+    def nnz(self) -> int:
+        # Number of stored (non-default) cells
+        return len(self.__cells)
+
+    @property
+    def default(self) -> T:
+        # The value every unset cell holds
+        return self.__default
+
+    def __check_bounds(self, row_index: int, column_index: int) -> None:
+        if not 0 <= row_index < self.__rows_len:
+            raise IndexError("Row index out of range")
+        if not 0 <= column_index < self.__cols_len:
+            raise IndexError("Column index out of range")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SparseArray2D):
+            return False
+        if self.__rows_len != other.__rows_len or self.__cols_len != other.__cols_len:
+            return False
+        if self.__default != other.__default:
+            return all(self.get(row, col) == other.get(row, col) for row in range(self.__rows_len) for col in range(self.__cols_len))
+        return self.__cells == other.__cells
+
+    def __getitem__(self, row_index: int) -> SparseArray2D.IRow[T]:
+        # Get the row at the specified row_index
+        if row_index >= self.__rows_len:
+            raise IndexError("Row index out of range")
+        return self.Row(row_index=row_index, array=self, num_columns=self.__cols_len)
+
+    def __iter__(self) -> Iterator[Sequence[T]]:
+        # Allow iteration over rows in the 2D array
+        return (self[row] for row in range(self.__rows_len))
+
+    def __reversed__(self) -> Iterator[Sequence[T]]:
+        # Allow reversed iteration over rows in the 2D array
+        return (self[row] for row in range(self.__rows_len - 1, -1, -1))
+
+    def __len__(self) -> int:
+        # Return the number of rows in the 2D array
+        return self.__rows_len
+
+    def __str__(self) -> str:
+        # Return string representation of the 2D array
+        return f"[{', '.join(str(row) for row in self)}]"
+
+    def __repr__(self) -> str:
+        # Return detailed string representation without printing every default cell
+        return f"SparseArray2D {self.__rows_len} Rows x {self.__cols_len} Columns, {len(self.__cells)} stored, default: {self.__default!r}"
+
+
+if __name__ == '__main__':
+    # If this file is run as a script, output the filename and a prompt for the user
+    filename = os.path.basename(__file__)
+    print(f"This is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.")
@@ -0,0 +1,267 @@
+from __future__ import annotations
+import json
+import os
+from typing import Any, Iterator, Mapping, Optional, Sequence, Tuple
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
+
+from datastructures.iarray2d import IArray2D, T
+
+
+def map_file(path: str | os.PathLike, shape: Tuple[int, ...], dtype: DTypeLike, mode: Optional[str] = None,
+             layout: Optional[Mapping[str, Any]] = None) -> np.memmap:
+    """ Map a raw binary file into memory with np.memmap.
+
+        When mode is None an existing file is opened read/write ('r+') and a missing one is created ('w+').
+        Creating a file only reserves its size, so even a very large grid opens instantly.
+
+        Two layouts can need the same number of bytes (4x6 and 6x4 cells, or different tile shapes), and
+        reading one as the other scrambles the data. So the shape, dtype and any extra layout fields (rows,
+        columns, tile) are saved next to the file in <path>.layout.json when it is created, and checked when
+        it is reopened. A file without that sidecar, such as one written by another tool, is only checked by size.
+
+        Raises:
+            ValueError: If the dtype holds Python objects, or an existing file does not match shape, dtype and layout.
+    """
+    dtype = np.dtype(dtype)
+    if dtype.hasobject:
+        raise ValueError("memory-mapped grids need a fixed-size dtype such as int, float or bool")
+    if mode is None:
+        mode = 'r+' if os.path.exists(path) else 'w+'
+    expected_layout = {'shape': list(shape), 'dtype': dtype.str, **(layout or {})}
+    layout_path = f"{os.fspath(path)}.layout.json"
+    if mode != 'w+':
+        expected = int(np.prod(shape)) * dtype.itemsize
+        actual = os.path.getsize(path)
+        if actual != expected:
+            raise ValueError(f"{path} holds {actual} bytes but a {shape} grid of {dtype} needs {expected}")
+        if os.path.exists(layout_path):
+            with open(layout_path) as layout_file:
+                saved_layout = json.load(layout_file)
+            if saved_layout != expected_layout:
+                raise ValueError(f"{path} was written as {saved_layout}, not {expected_layout}")
+    storage = np.memmap(path, dtype=dtype, mode=mode, shape=shape)
+    if mode == 'w+':
+        with open(layout_path, 'w') as layout_file:
+            json.dump(expected_layout, layout_file)
+    return storage
+
+
+class TiledArray2D(IArray2D[T]):
+    """ A two-dimensional array stored as fixed-size tiles, usually in a memory-mapped file.
+        Each tile is contiguous in storage, so reading a rectangular region only touches the disk pages of
+        the tiles it overlaps instead of one strip per row. The grid is padded up to a whole number of tiles.
+        Use Array2D.open_mmap(..., tile=(256, 256)) or TiledArray2D.open(...) to work with a file.
+    """
+
+    class Row(IArray2D.IRow[T]):
+        def __init__(self, row_index: int, array: TiledArray2D, num_columns: int) -> None:
+            # Initialize Row with row_index, the tiled array it belongs to, and the number of columns
+            self.__row_index = row_index
+            self.__array = array
+            self.__num_columns = num_columns
+
+        def __getitem__(self, column_index: int) -> T:
+            # Get the item at the specified column_index in this row
+            if column_index >= self.__num_columns:
+                raise IndexError("Column index out of range")
+            return self.__array.get(self.__row_index, column_index)
+
+        def __setitem__(self, column_index: int, value: T) -> None:
+            # Set the item at the specified column_index in this row
+            if column_index >= self.__num_columns:
+                raise IndexError("Column index out of range")
+            self.__array.set(self.__row_index, column_index, value)
+
+        def __iter__(self) -> Iterator[T]:
+            # Allow iteration over items in this row
+            return (self[i] for i in range(self.__num_columns))
+
+        def __reversed__(self) -> Iterator[T]:
+            # Allow reversed iteration over items in this row
+            return (self[i] for i in range(self.__num_columns - 1, -1, -1))
+
+        def __len__(self) -> int:
+            # Return the number of columns in this row
+            return self.__num_columns
+
+        def __str__(self) -> str:
+            # Return string representation of this row
+            return f"[{', '.join(str(item) for item in self)}]"
+
+        def __repr__(self) -> str:
+            # Return detailed string representation of this row
+            return f"Row {self.__row_index}: {str(self)}"
+
+
+    def __init__(self, starting_sequence: Sequence[Sequence[T]] = [[]], data_type=object, tile: Tuple[int, int] = (256, 256)) -> None:
+        # Build an in-memory tiled array from a sequence of sequences. Only numeric and bool data can be tiled
+        try:
+            if not all(isinstance(row, Sequence) and not isinstance(row, str) for row in starting_sequence):
+                raise ValueError("must be a sequence of sequences")
+        except TypeError:
+            raise ValueError("must be a sequence of sequences")
+
+        data_type = type(starting_sequence[0][0]) if data_type == object else data_type
+        rows, cols = len(starting_sequence), len(starting_sequence[0])
+        if not all(len(row) == cols and all(isinstance(item, data_type) for item in row) for row in starting_sequence):
+            raise ValueError("All items must be of the same type and all rows must have the same length")
+
+        self.__setup(TiledArray2D.__allocate(rows, cols, data_type, tile), rows, cols, data_type)
+        self.write_region(0, 0, np.array(starting_sequence, dtype=data_type).reshape(rows, cols))
+
+    @staticmethod
+    def empty(rows: int = 0, cols: int = 0, data_type: type = float, tile: Tuple[int, int] = (256, 256)) -> TiledArray2D:
+        # Create an in-memory tiled array of zeros
+        array: TiledArray2D = TiledArray2D.__new__(TiledArray2D)
+        array.__setup(TiledArray2D.__allocate(rows, cols, data_type, tile), rows, cols, data_type)
+        return array
+
+    @staticmethod
+    def open(path: str | os.PathLike, rows: int, cols: int, dtype: DTypeLike = float, tile: Tuple[int, int] = (256, 256), mode: Optional[str] = None) -> TiledArray2D:
+        # Open (or create) a tiled grid file. Reopening with the same rows, cols, dtype and tile resumes it instantly
+        tile_rows, tile_cols = TiledArray2D.__check_tile(tile)
+        shape = (-(-rows // tile_rows), -(-cols // tile_cols), tile_rows, tile_cols)
+        storage = map_file(path, shape, dtype, mode, layout={'rows': rows, 'cols': cols, 'tile': [tile_rows, tile_cols]})
+        array: TiledArray2D = TiledArray2D.__new__(TiledArray2D)
+        array.__setup(storage, rows, cols, type(np.zeros(1, dtype=storage.dtype)[0].item()))
+        return array
+
+    @staticmethod
+    def __check_tile(tile: Tuple[int, int]) -> Tuple[int, int]:
+        tile_rows, tile_cols = tile
+        if tile_rows <= 0 or tile_cols <= 0:
+            raise ValueError("tile dimensions must be positive")
+        return tile_rows, tile_cols
+
+    @staticmethod
+    def __allocate(rows: int, cols: int, data_type: type, tile: Tuple[int, int]) -> NDArray:
+        tile_rows, tile_cols = TiledArray2D.__check_tile(tile)
+        if np.dtype(data_type).hasobject:
+            raise ValueError("TiledArray2D only holds numeric or bool data")
+        return np.zeros((-(-rows // tile_rows), -(-cols // tile_cols), tile_rows, tile_cols), dtype=data_type)
+
+    def __setup(self, storage: NDArray, rows: int, cols: int, data_type: type) -> None:
+        # storage has shape (tiles down, tiles across, tile rows, tile columns)
+        self.__storage = storage
+        self.__rows_len = rows
+        self.__cols_len = cols
+        self.__data_type = data_type
+        self.__tile_rows, self.__tile_cols = storage.shape[2], storage.shape[3]
+
+    def get(self, row_index: int, column_index: int) -> T:
+        # Get a single cell
+        self.__check_bounds(row_index, column_index)
+        tile_row, cell_row = divmod(row_index, self.__tile_rows)
+        tile_col, cell_col = divmod(column_index, self.__tile_cols)
+        return self.__storage[tile_row, tile_col, cell_row, cell_col]
+
+    def set(self, row_index: int, column_index: int, value: T) -> None:
+        # Set a single cell
+        self.__check_bounds(row_index, column_index)
+        if not isinstance(value, self.__data_type):
+            raise TypeError(f"Item must be of type {self.__data_type.__name__}")
+        tile_row, cell_row = divmod(row_index, self.__tile_rows)
+        tile_col, cell_col = divmod(column_index, self.__tile_cols)
+        self.__storage[tile_row, tile_col, cell_row, cell_col] = value
+
+    def read_region(self, row_start: int, row_stop: int, col_start: int, col_stop: int) -> NDArray:
+        # Copy the cells in [row_start, row_stop) x [col_start, col_stop) into a new NumPy array,
+        # reading one contiguous block per overlapped tile
+        self.__check_region(row_start, row_stop, col_start, col_stop)
+        region = np.empty((row_stop - row_start, col_stop - col_start), dtype=self.__storage.dtype)
+        for tile_row, tile_col, cells, target in self.__tiles_in(row_start, row_stop, col_start, col_stop):
+            region[target] = self.__storage[tile_row, tile_col][cells]
+        return region
+
+    def write_region(self, row_start: int, col_start: int, values: NDArray) -> None:
+        # Copy a two-dimensional NumPy array into the grid with its top-left corner at (row_start, col_start)
+        values = np.asarray(values)
+        if values.ndim != 2:
+            raise ValueError("values must be two-dimensional")
+        row_stop, col_stop = row_start + values.shape[0], col_start + values.shape[1]
+        self.__check_region(row_start, row_stop, col_start, col_stop)
+        for tile_row, tile_col, cells, source in self.__tiles_in(row_start, row_stop, col_start, col_stop):
+            self.__storage[tile_row, tile_col][cells] = values[source]
+
+    def __tiles_in(self, row_start: int, row_stop: int, col_start: int, col_stop: int) -> Iterator[Tuple[int, int, Tuple[slice, slice], Tuple[slice, slice]]]:
+        # Yield (tile row, tile column, slice inside the tile, slice inside the region) for every tile a region overlaps
+        if row_start == row_stop or col_start == col_stop:
+            return
+        for tile_row in range(row_start // self.__tile_rows, (row_stop - 1) // self.__tile_rows + 1):
+            top = tile_row * self.__tile_rows
+            first_row, last_row = max(row_start, top), min(row_stop, top + self.__tile_rows)
+            for tile_col in range(col_start // self.__tile_cols, (col_stop - 1) // self.__tile_cols + 1):
+                left = tile_col * self.__tile_cols
+                first_col, last_col = max(col_start, left), min(col_stop, left + self.__tile_cols)
+                yield (tile_row, tile_col,
+                       (slice(first_row - top, last_row - top), slice(first_col - left, last_col - left)),
+                       (slice(first_row - row_start, last_row - row_start), slice(first_col - col_start, last_col - col_start)))
+
+    def to_numpy(self) -> NDArray:
+        # Copy the whole grid into a (rows, cols) NumPy array
+        return self.read_region(0, self.__rows_len, 0, self.__cols_len)
+
+    def flush(self) -> None:
+        # Write pending changes of a memory-mapped grid to disk. Does nothing for in-memory grids
+        if isinstance(self.__storage, np.memmap):
+            self.__storage.flush()
+
+    @property
+    def tile(self) -> Tuple[int, int]:
+        # The (rows, columns) of a single tile
+        return (self.__tile_rows, self.__tile_cols)
+
+    @property
+    def data_type(self) -> type:
+        # The type every cell holds
+        return self.__data_type
+
+    def __check_bounds(self, row_index: int, column_index: int) -> None:
+        if not 0 <= row_index < self.__rows_len:
+            raise IndexError("Row index out of range")
+        if not 0 <= column_index < self.__cols_len:
+            raise IndexError("Column index out of range")
+
+    def __check_region(self, row_start: int, row_stop: int, col_start: int, col_stop: int) -> None:
+        if not (0 <= row_start <= row_stop <= self.__rows_len and 0 <= col_start <= col_stop <= self.__cols_len):
+            raise IndexError("Region out of range")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TiledArray2D):
+            return False
+        if self.__rows_len != other.__rows_len or self.__cols_len != other.__cols_len:
+            return False
+        return bool(np.array_equal(self.to_numpy(), other.to_numpy()))
+
+    def __getitem__(self, row_index: int) -> TiledArray2D.IRow[T]:
+        # Get the row at the specified row_index
+        if row_index >= self.__rows_len:
+            raise IndexError("Row index out of range")
+        return self.Row(row_index=row_index, array=self, num_columns=self.__cols_len)
+
+    def __iter__(self) -> Iterator[Sequence[T]]:
+        # Allow iteration over rows in the 2D array
+        return (self[row] for row in range(self.__rows_len))
+
+    def __reversed__(self) -> Iterator[Sequence[T]]:
+        # Allow reversed iteration over rows in the 2D array
+        return (self[row] for row in range(self.__rows_len - 1, -1, -1))
+
+    def __len__(self) -> int:
+        # Return the number of rows in the 2D array
+        return self.__rows_len
+
+    def __str__(self) -> str:
+        # Return string representation of the 2D array
+        return f"[{', '.join(str(row) for row in self)}]"
+
+    def __repr__(self) -> str:
+        # Return a short description; printing every cell of a large on-disk grid is never what you want
+        return f"TiledArray2D {self.__rows_len} Rows x {self.__cols_len} Columns, tiles: {self.__tile_rows}x{self.__tile_cols}, type: {self.__data_type.__name__}"
+
+
+if __name__ == '__main__':
+    # If this file is run as a script, output the filename and a prompt for the user
+    filename = os.path.basename(__file__)
+    print(f"This is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.")
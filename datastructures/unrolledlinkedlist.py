@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+import os
+from typing import Iterator, Optional, Sequence, Tuple
+from datastructures.ilinkedlist import ILinkedList, T
+from datastructures import linkedlist
+
+
+class UnrolledLinkedList[T](ILinkedList[T]):
+    ''' A doubly linked list whose nodes each hold up to `capacity` items in a small deque.
+        Walking the list touches one node per `capacity` items instead of one per item, and the
+        per-item overhead is a deque slot instead of a whole node. append, pop, prepend and pop_front
+        are O(1) amortized; a node that overflows in the middle is split in half, and one that drops
+        below half full merges with or borrows from its next neighbor, so every node but the head and
+        tail stays at least half full whatever mix of inserts and removes the list sees.
+    '''
+
+    DEFAULT_CAPACITY = 64
+
+    @dataclass(slots=True, eq=False)
+    class Node:
+        items: deque = field(default_factory=deque)
+        next: Optional[UnrolledLinkedList.Node] = None
+        previous: Optional[UnrolledLinkedList.Node] = None
+
+    def __init__(self, data_type: type = object, capacity: int = DEFAULT_CAPACITY, check_types: Optional[str] = None) -> None:
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self.head: Optional[UnrolledLinkedList.Node] = None
+        self.tail: Optional[UnrolledLinkedList.Node] = None
+        self.count: int = 0
+        self.data_type = data_type
+        self.capacity = capacity
+        self.check_types, self._type_checked = linkedlist._resolve_check_types(check_types)
+
+    @staticmethod
+    def from_sequence(sequence: Sequence[T], data_type: type=object, capacity: int = DEFAULT_CAPACITY,
+                      check_types: Optional[str] = None) -> UnrolledLinkedList[T]:
+        linked_list: UnrolledLinkedList[T] = UnrolledLinkedList(data_type=data_type, capacity=capacity, check_types=check_types)
+
+        for item in sequence:
+            linked_list.append(item)
+        return linked_list
+
+    def append(self, item: T) -> None:
+        if self._type_checked and not isinstance(item, self.data_type):
+            raise TypeError(f"Item must be of type {self.data_type.__name__}")
+
+        if self.tail is None or len(self.tail.items) >= self.capacity:
+            self._link_after(self.tail, UnrolledLinkedList.Node())
+        self.tail.items.append(item)
+        self.count += 1
+
+    def prepend(self, item: T) -> None:
+        if self._type_checked and not isinstance(item, self.data_type):
+            raise TypeError(f"Item must be of type {self.data_type.__name__}")
+
+        if self.head is None or len(self.head.items) >= self.capacity:
+            self._link_before(self.head, UnrolledLinkedList.Node())
+        self.head.items.appendleft(item)
+        self.count += 1
+
+    def insert_before(self, target: T, item: T) -> None:
+        if self._type_checked and not isinstance(item, self.data_type):
+            raise TypeError(f"Item must be of type {self.data_type.__name__}")
+        if self._type_checked and not isinstance(target, self.data_type):
+            raise TypeError(f"Target must be of type {self.data_type.__name__}")
+
+        node, index = self._find(target)
+        self._insert_at(node, index, item)
+
+    def insert_after(self, target: T, item: T) -> None:
+        if self._type_checked and not isinstance(item, self.data_type):
+            raise TypeError(f"Item must be of type {self.data_type.__name__}")
+        if self._type_checked and not isinstance(target, self.data_type):
+            raise TypeError(f"Target must be of type {self.data_type.__name__}")
+
+        node, index = self._find(target)
+        self._insert_at(node, index + 1, item)
+
+    def remove(self, item: T) -> None:
+        if self._type_checked and not isinstance(item, self.data_type):
+            raise TypeError(f"Item must be of type {self.data_type.__name__}")
+
+        node, index = self._find(item)
+        del node.items[index]
+        self.count -= 1
+        self._rebalance(node)
+
+    def remove_all(self, item: T) -> None:
+        if self._type_checked and not isinstance(item, self.data_type):
+            raise TypeError(f"Item must be of type {self.data_type.__name__}")
+
+        current = self.head
+        while current:
+            next_node = current.next
+            kept = deque(existing for existing in current.items if existing != item)
+            self.count -= len(current.items) - len(kept)
+            current.items = kept
+            if not kept:
+                self._unlink(current)
+            current = next_node
+
+        # Rebalance once everything is filtered, so no node absorbs items that still had to be checked
+        current = self.head
+        while current:
+            self._rebalance(current)
+            current = current.next
+
+    def pop(self) -> T:
+        if self.empty:
+            raise IndexError("LinkedList is empty")
+
+        data = self.tail.items.pop()
+        self.count -= 1
+        if not self.tail.items:
+            self._unlink(self.tail)
+        return data
+
+    def pop_front(self) -> T:
+        if self.empty:
+            raise IndexError("LinkedList is empty")
+
+        data = self.head.items.popleft()
+        self.count -= 1
+        self._rebalance(self.head)
+        return data
+
+    @property
+    def front(self) -> T:
+        if self.empty:
+            raise IndexError("LinkedList is empty")
+        return self.head.items[0]
+
+    @property
+    def back(self) -> T:
+        if self.empty:
+            raise IndexError("LinkedList is empty")
+        return self.tail.items[-1]
+
+    @property
+    def empty(self) -> bool:
+        return self.count == 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self) -> None:
+        self.head = None
+        self.tail = None
+        self.count = 0
+
+    def __contains__(self, item: T) -> bool:
+        current = self.head
+        while current:
+            if item in current.items:
+                return True
+            current = current.next
+        return False
+
+    def __iter__(self) -> Iterator[T]:
+        # Walks each node by index, like a list iterator, so the loop body may remove items: items a removal
+        # moves into the current node are still visited, and a node emptied under the loop is stepped past
+        current, index = self.head, 0
+        while current:
+            if index < len(current.items):
+                next_node = current.next
+                yield current.items[index]
+                index += 1
+                continue
+            if current.previous is None and current is not self.head:
+                current = next_node  # unlinked while the loop was inside it
+            else:
+                current = current.next
+            index = 0
+
+    def __next__(self) -> T:
+        raise TypeError("UnrolledLinkedList is not an iterator; call iter() on it first")
+
+    def __reversed__(self) -> Iterator[T]:
+        # The same walk as __iter__, from the tail
+        current = self.tail
+        index = len(current.items) - 1 if current else -1
+        while current:
+            if 0 <= index < len(current.items):
+                previous_node = current.previous
+                yield current.items[index]
+                index -= 1
+                continue
+            if current.next is None and current is not self.tail:
+                current = previous_node  # unlinked while the loop was inside it
+            else:
+                current = current.previous
+            index = len(current.items) - 1 if current else -1
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, UnrolledLinkedList):
+            return False
+        if len(self) != len(other):
+            return False
+        return all(mine == theirs for mine, theirs in zip(self, other))
+
+    def __str__(self) -> str:
+        return '[' + ', '.join(repr(item) for item in self) + ']'
+
+    def __repr__(self) -> str:
+        nodes = 0
+        current = self.head
+        while current:
+            nodes += 1
+            current = current.next
+        return f"UnrolledLinkedList({' <-> '.join(repr(item) for item in self)}) Count: {self.count}, Nodes: {nodes}"
+
+    def _find(self, target: T) -> Tuple[UnrolledLinkedList.Node, int]:
+        # Locate the first occurrence of target as (node, index inside the node)
+        current = self.head
+        while current:
+            for index, item in enumerate(current.items):
+                if item == target:
+                    return current, index
+            current = current.next
+        raise ValueError(f"The target item {target} is not in the linked list.")
+
+    def _insert_at(self, node: UnrolledLinkedList.Node, index: int, item: T) -> None:
+        # Insert into a node, splitting it in half when it would grow past capacity
+        node.items.insert(index, item)
+        self.count += 1
+        if len(node.items) > self.capacity:
+            upper = UnrolledLinkedList.Node()
+            for _ in range(len(node.items) - len(node.items) // 2):
+                upper.items.appendleft(node.items.pop())
+            self._link_after(node, upper)
+
+    def _rebalance(self, node: UnrolledLinkedList.Node) -> None:
+        # Called after items were removed from node. An emptied node is dropped. A node under half full absorbs
+        # its next neighbor when both fit in one node, or else takes just enough of the neighbor's first items;
+        # the neighbor keeps at least half of capacity either way
+        if not node.items:
+            self._unlink(node)
+            return
+        half = self.capacity // 2
+        while len(node.items) < half and node.next:
+            neighbor = node.next
+            if len(node.items) + len(neighbor.items) <= self.capacity:
+                node.items.extend(neighbor.items)
+                self._unlink(neighbor)
+            else:
+                while len(node.items) < half:
+                    node.items.append(neighbor.items.popleft())
+
+    def _link_after(self, anchor: Optional[UnrolledLinkedList.Node], new_node: UnrolledLinkedList.Node) -> None:
+        if anchor is None:
+            self.head = self.tail = new_node
+            return
+        new_node.previous = anchor
+        new_node.next = anchor.next
+        if anchor.next:
+            anchor.next.previous = new_node
+        else:
+            self.tail = new_node
+        anchor.next = new_node
+
+    def _link_before(self, anchor: Optional[UnrolledLinkedList.Node], new_node: UnrolledLinkedList.Node) -> None:
+        if anchor is None:
+            self.head = self.tail = new_node
+            return
+        new_node.next = anchor
+        new_node.previous = anchor.previous
+        if anchor.previous:
+            anchor.previous.next = new_node
+        else:
+            self.head = new_node
+        anchor.previous = new_node
+
+    def _unlink(self, node: UnrolledLinkedList.Node) -> None:
+        # Drop an empty node from the chain. Item counts are kept by the callers
+        if node.previous:
+            node.previous.next = node.next
+        else:
+            self.head = node.next
+
+        if node.next:
+            node.next.previous = node.previous
+        else:
+            self.tail = node.previous
+
+        node.next = node.previous = None
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'OOPS!\nThis is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
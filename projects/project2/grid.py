@@ -2,6 +2,7 @@ from __future__ import annotations
 from projects.project2.cell import Cell
 from datastructures.array2d import Array2D
 import random
+import numpy as np
 
 class Grid:
     def __init__(self, rows: int = 10, cols: int = 10):
@@ -20,16 +21,21 @@ class Grid:
 
     def read_config(self, filename: str):
         with open(filename, 'r') as file:
-            lines = file.readlines()
             # Skip lines that start with a '#' (comments)
-            lines = [line.strip() for line in lines if not line.strip().startswith('#')]
-            self.rows = int(lines[0])
-            self.cols = int(lines[1])
-            self.grid = Array2D.empty(self.rows, self.cols, data_type=Cell)
+            header = (line.strip() for line in file if not line.strip().startswith('#'))
+            self.rows = int(next(header))
+            self.cols = int(next(header))
 
-            for row in range(self.rows):
-                for col, char in enumerate(lines[row + 2]):  # Start reading from line 3
-                    self.grid[row][col].is_alive = (char == 'X')
+            def parse_row(line: str) -> list[bool] | None:
+                line = line.strip()
+                if line.startswith('#'):
+                    return None
+                return [char == 'X' for char in line[:self.cols].ljust(self.cols)]
+
+            # The rest of the file is streamed straight into a bool grid
+            alive = Array2D.from_text(file, parser=parse_row, data_type=bool, max_rows=self.rows)
+            alive.resize(self.rows, self.cols, fill=False)
+            self.grid = Array2D([[Cell(is_alive) for is_alive in row] for row in alive.to_numpy().tolist()], data_type=Cell)
 
     def display(self) -> None:
         separator = '-' * (self.cols * 2 - 1)  # Separator line based on the number of columns
@@ -53,11 +59,18 @@ class Grid:
 
         return count
 
+    def neighbor_counts(self) -> Array2D[int]:
+        # Live-neighbor count for every cell at once, instead of calling get_neighbors per cell
+        alive = Array2D.from_numpy(np.array([[cell.is_alive for cell in row] for row in self.grid], dtype=bool), data_type=bool)
+        return alive.neighbor_sum(radius=1, boundary='zero')
+
     def next_gen(self) -> Grid:
         next_grid = Grid(self.rows, self.cols)
+        neighbor_counts = self.neighbor_counts()
         for row in range(self.rows):
             for col in range(self.cols):
-                num_neighbors = self.get_neighbors(row, col)
+                # Plain int, so next_state stores a Python bool rather than np.bool_ in the cell
+                num_neighbors = int(neighbor_counts[row][col])
                 next_state = self.grid[row][col].next_state(num_neighbors)
                 next_grid.grid[row][col].is_alive = next_state
         return next_grid
@@ -1,5 +1,6 @@
 import copy
 import pytest
+import numpy as np
 from datastructures.array import Array
 
 from tests.car import Car, Color, Make, Model
@@ -130,3 +131,14 @@ class TestArray:
     def test_bracket_operator_should_raise_a_type_error_if_the_index_is_not_an_integer_or_slice(self, setup_numerical_array: Array):
         with pytest.raises(TypeError):
             setup_numerical_array['string'] #type: ignore
+
+    def test_from_numpy_should_share_storage_with_the_numpy_array_passed_in(self):
+        elements = np.arange(5)
+        array = Array.from_numpy(elements, data_type=int)
+        elements[0] = 42
+        assert array[0] == 42
+        assert len(array) == 5
+
+    def test_to_numpy_should_return_only_the_used_elements(self, setup_numerical_array: Array):
+        setup_numerical_array.append(10)
+        assert setup_numerical_array.to_numpy().tolist() == list(range(11))
@@ -1,6 +1,14 @@
+import io
+import numpy as np
 import pytest
 from datastructures.array2d import Array2D
 
+def count_band_neighbors(band: np.ndarray) -> np.ndarray:
+    """Counts live neighbors inside one band; used by the parallel_apply tests (module level so it can be pickled)."""
+    padded = np.pad(band.astype(np.int64), 1)
+    rows, cols = band.shape
+    return sum(padded[1 + dr:1 + dr + rows, 1 + dc:1 + dc + cols] for dr in (-1, 0, 1) for dc in (-1, 0, 1) if (dr, dc) != (0, 0))
+
 class TestArray2D:
     
     # ✅ Fixtures to create test instances of Array2D
@@ -107,4 +115,239 @@ class TestArray2D:
     def test_init_inconsistent_lengths(self) -> None:
         """Ensures a ValueError is raised if rows in `starting_sequence` have different lengths."""
         with pytest.raises(ValueError):
-            _ = Array2D([[1, 2, 3], [4, 5]], data_type=int)
\ No newline at end of file
+            _ = Array2D([[1, 2, 3], [4, 5]], data_type=int)
+    # ✅ Test Neighbor Sum (Game of Life neighbor counts)
+    def test_neighbor_sum(self) -> None:
+        """Ensures neighbor_sum counts the live neighbors of every cell, excluding the cell itself."""
+        alive = Array2D([[True, False, True], [False, True, False]], data_type=bool)
+        assert [list(row) for row in alive.neighbor_sum()] == [[1, 3, 1], [2, 2, 2]]
+        assert [list(row) for row in alive.neighbor_sum(boundary='wrap')] == [[3, 4, 3], [5, 4, 5]]
+
+    # ✅ Test Convolution with each boundary mode
+    def test_convolve_boundaries(self, filled3x3: Array2D[int]) -> None:
+        """Checks convolve against hand-computed results for the zero, wrap and reflect boundaries."""
+        cross = [[0, 1, 0], [1, 0, 1], [0, 1, 0]]
+        assert [list(row) for row in filled3x3.convolve(cross)] == [[6, 9, 8], [13, 20, 17], [12, 21, 14]]
+        assert [list(row) for row in filled3x3.convolve(cross, boundary='wrap')][1][1] == 20
+        assert [list(row) for row in filled3x3.convolve(cross, boundary='wrap')][0][0] == 2 + 3 + 4 + 7
+        assert [list(row) for row in filled3x3.convolve(cross, boundary='reflect')][0][0] == 2 + 2 + 4 + 4
+
+    # ✅ Test Convolution flips the kernel and leaves the original untouched
+    def test_convolve_flips_kernel(self, filled3x3: Array2D[int]) -> None:
+        """Ensures convolve is a true convolution (kernel flipped) and returns a new Array2D."""
+        shift = [[0, 0, 0], [1, 0, 0], [0, 0, 0]]
+        assert [list(row) for row in filled3x3.convolve(shift)] == [[2, 3, 0], [5, 6, 0], [8, 9, 0]]
+        assert [list(row) for row in filled3x3] == [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+
+    # ✅ Test invalid convolve arguments
+    def test_convolve_invalid(self, filled3x3: Array2D[int]) -> None:
+        """Ensures bad kernels, boundaries and non-numeric grids are rejected."""
+        with pytest.raises(ValueError):
+            filled3x3.convolve([[1, 1], [1, 1]])  # Even-sized kernel has no center
+        with pytest.raises(ValueError):
+            filled3x3.convolve([[1]], boundary='nearest')
+        with pytest.raises(TypeError):
+            Array2D([["a", "b"]], data_type=str).neighbor_sum()
+
+    # ✅ Test Equality
+    def test_eq(self, filled3x3: Array2D[int]) -> None:
+        """Checks that equal grids compare equal and that shape or content differences are detected."""
+        other = Array2D([[1, 2, 3], [4, 5, 6], [7, 8, 9]], data_type=int)
+        assert filled3x3 == other
+        other[2][2] = 0
+        assert filled3x3 != other
+        assert filled3x3 != Array2D([[1, 2, 3], [4, 5, 6]], data_type=int)
+        assert filled3x3 != [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+
+    # ✅ Test Digest is invalidated on writes
+    def test_digest(self, filled3x3: Array2D[int]) -> None:
+        """Ensures digest matches for equal content and changes after a write through a row."""
+        other = Array2D([[1, 2, 3], [4, 5, 6], [7, 8, 9]], data_type=int)
+        before = filled3x3.digest()
+        assert before == other.digest()
+        filled3x3[1][1] = 50
+        assert filled3x3.digest() != before
+        assert filled3x3 != other
+        filled3x3[1][1] = 5
+        assert filled3x3.digest() == before
+        assert filled3x3 == other
+
+    # ✅ Test from_numpy does not share the caller's array
+    def test_from_numpy_copies(self, filled3x3: Array2D[int]) -> None:
+        """Ensures writing to the source array afterwards can't make the cached digest stale."""
+        values = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+        array2d = Array2D.from_numpy(values)
+        assert array2d.digest() == filled3x3.digest()
+        values[1][1] = 50
+        assert array2d[1][1] == 5
+        assert array2d == filled3x3
+
+    # ✅ Test Appending Rows to an empty Array
+    def test_append_row(self) -> None:
+        """Ensures rows can be appended one at a time starting from an empty Array2D."""
+        array2d = Array2D.empty(rows=0, cols=0, data_type=int)
+        for i in range(10):
+            array2d.append_row([i, i * 10])
+        assert len(array2d) == 10
+        assert list(array2d[9]) == [9, 90]
+        with pytest.raises(ValueError):
+            array2d.append_row([1, 2, 3])  # Wrong row length
+        with pytest.raises(TypeError):
+            array2d.append_row([1, "two"])  # Wrong item type
+
+    # ✅ Test Appended object rows are copies
+    def test_append_row_copies_objects(self) -> None:
+        """Ensures appended and inserted object rows don't share their items with the caller, like __init__."""
+        row = [[1], [2]]
+        array2d = Array2D([row], data_type=list)
+        array2d.append_row(row)
+        array2d.insert_row(0, row)
+        array2d.append_column([[3], [4], [5]])
+        row[0].append(99)
+        assert [list(line) for line in array2d] == [[[1], [2], [3]], [[1], [2], [4]], [[1], [2], [5]]]
+        assert array2d[0][0] is not array2d[1][0]
+
+    # ✅ Test Appending Columns
+    def test_append_column(self, filled3x3: Array2D[int]) -> None:
+        """Checks that append_column adds a value to the end of every row."""
+        filled3x3.append_column([10, 11, 12])
+        filled3x3.append_column([13, 14, 15])
+        assert [list(row) for row in filled3x3] == [[1, 2, 3, 10, 13], [4, 5, 6, 11, 14], [7, 8, 9, 12, 15]]
+        filled3x3[2][4] = 0
+        assert filled3x3[2][4] == 0 and filled3x3[2][3] == 12
+
+    # ✅ Test Negative Indices skip spare capacity
+    def test_negative_indices_after_growth(self, filled3x3: Array2D[int]) -> None:
+        """Ensures negative row and column indices count from the used cells, not the reserved capacity."""
+        filled3x3.append_row([10, 11, 12])
+        filled3x3.append_column([20, 21, 22, 23])
+        assert list(filled3x3[-1]) == [10, 11, 12, 23]
+        assert filled3x3[-1][-1] == 23 and filled3x3[0][-1] == 20 and filled3x3[-4][-4] == 1
+        filled3x3[-1][-2] = 99
+        assert filled3x3[3][2] == 99
+        with pytest.raises(IndexError):
+            _ = filled3x3[-5]
+        with pytest.raises(IndexError):
+            _ = filled3x3[0][-5]
+        with pytest.raises(IndexError):
+            filled3x3[0][-5] = 0
+
+    # ✅ Test Inserting and Deleting Rows
+    def test_insert_delete_row(self, filled3x3: Array2D[int]) -> None:
+        """Verifies rows shift correctly when inserting and deleting in the middle."""
+        filled3x3.insert_row(1, [0, 0, 0])
+        assert [list(row) for row in filled3x3] == [[1, 2, 3], [0, 0, 0], [4, 5, 6], [7, 8, 9]]
+        filled3x3.delete_row(0)
+        filled3x3.delete_row(-1)
+        assert [list(row) for row in filled3x3] == [[0, 0, 0], [4, 5, 6]]
+        with pytest.raises(IndexError):
+            filled3x3.delete_row(2)
+
+    # ✅ Test Resizing
+    def test_resize(self, filled3x3: Array2D[int]) -> None:
+        """Checks that resize keeps overlapping cells and fills new ones."""
+        filled3x3.resize(2, 4, fill=-1)
+        assert [list(row) for row in filled3x3] == [[1, 2, 3, -1], [4, 5, 6, -1]]
+        filled3x3.resize(3, 2)
+        assert [list(row) for row in filled3x3] == [[1, 2], [4, 5], [0, 0]]
+        assert filled3x3 == Array2D([[1, 2], [4, 5], [0, 0]], data_type=int)
+
+    # ✅ Test Memory-Mapped Array persists across reopening
+    def test_open_mmap(self, tmp_path) -> None:
+        """Ensures writes to a memory-mapped Array2D survive closing and reopening the file."""
+        path = tmp_path / "grid.bin"
+        grid = Array2D.open_mmap(path, rows=4, cols=5, dtype=int)
+        assert grid[3][4] == 0
+        grid[2][3] = 7
+        grid.flush()
+        del grid
+
+        reopened = Array2D.open_mmap(path, rows=4, cols=5, dtype=int)
+        assert reopened[2][3] == 7
+        assert reopened.neighbor_sum()[2][2] == 7
+        with pytest.raises(ValueError):
+            reopened.append_row([0, 0, 0, 0, 0])  # Shape is fixed by the file
+        with pytest.raises(ValueError):
+            Array2D.open_mmap(path, rows=5, cols=5, dtype=int)  # File size does not match
+        with pytest.raises(ValueError):
+            Array2D.open_mmap(path, rows=5, cols=4, dtype=int)  # Same size, different shape
+
+    # ✅ Test streaming text round trip
+    def test_from_text_to_text(self, filled3x3: Array2D[int]) -> None:
+        """Ensures to_text output can be read back by from_text in small chunks."""
+        text = io.StringIO()
+        filled3x3.to_text(text)
+        assert text.getvalue() == "1,2,3\n4,5,6\n7,8,9\n"
+        text.seek(0)
+        assert Array2D.from_text(text, data_type=int, chunk_rows=2) == filled3x3
+
+    # ✅ Test from_text with a custom parser and max_rows
+    def test_from_text_parser(self) -> None:
+        """Checks that a parser can skip lines and that reading stops at max_rows."""
+        lines = ["# comment", "X-X", "-X-", "XXX", "---"]
+        parse = lambda line: None if line.startswith('#') else [char == 'X' for char in line]
+        alive = Array2D.from_text(lines, parser=parse, data_type=bool, max_rows=2)
+        assert [list(row) for row in alive] == [[True, False, True], [False, True, False]]
+        with pytest.raises(ValueError):
+            Array2D.from_text(["1,2", "3"], data_type=int)  # Ragged rows
+
+    # ✅ Test parallel_apply with halo rows on both backends
+    @pytest.mark.parametrize("backend", ["thread", "process"])
+    def test_parallel_apply(self, backend: str) -> None:
+        """Ensures bands with a one-row halo stitch together into the same result as a single pass."""
+        alive = Array2D.from_numpy(np.random.default_rng(0).random((30, 20)) < 0.4)
+        counts = alive.parallel_apply(count_band_neighbors, bands=4, halo=1, backend=backend, dtype=np.int64)
+        assert counts == alive.neighbor_sum()
+
+    # ✅ Test parallel_apply without a halo sees only its own rows
+    def test_parallel_apply_no_halo(self, filled3x3: Array2D[int]) -> None:
+        """Checks that every band is transformed independently and rows stay in order."""
+        doubled = filled3x3.parallel_apply(lambda band: band * 2, bands=3)
+        assert [list(row) for row in doubled] == [[2, 4, 6], [8, 10, 12], [14, 16, 18]]
+        with pytest.raises(ValueError):
+            filled3x3.parallel_apply(lambda band: band, backend="gpu")
+        with pytest.raises(ValueError):
+            filled3x3.parallel_apply(lambda band: band, bands=0)
+
+    # ✅ Test dirty-row tracking
+    def test_take_dirty_rows(self, filled3x3: Array2D[int]) -> None:
+        """Ensures writes are recorded per row and take_dirty starts over after each call."""
+        with pytest.raises(ValueError):
+            filled3x3.take_dirty()  # Tracking is off by default
+        filled3x3.track_dirty('row')
+        filled3x3[0][1] = 10
+        filled3x3[2][2] = 10
+        filled3x3[2][0] = 10
+        assert filled3x3.take_dirty() == {0, 2}
+        assert filled3x3.take_dirty() == set()
+        filled3x3.insert_row(1, [0, 0, 0])
+        assert filled3x3.take_dirty() == {1, 2, 3}
+
+    # ✅ Test dirty tracking by tile and by cell
+    def test_take_dirty_tiles_and_cells(self) -> None:
+        """Checks tile and cell granularities report the right coordinates."""
+        array2d = Array2D.empty(rows=8, cols=8, data_type=int)
+        array2d.track_dirty('tile', tile=(4, 4))
+        array2d[1][1] = 1
+        array2d[5][6] = 1
+        assert array2d.take_dirty() == {(0, 0), (1, 1)}
+        array2d.track_dirty('cell')
+        array2d[7][0] = 1
+        assert array2d.take_dirty() == {(7, 0)}
+        array2d.track_dirty(None)
+        with pytest.raises(ValueError):
+            array2d.take_dirty()
+
+    # ✅ Test growing the grid only dirties the new cells
+    def test_take_dirty_after_growth(self, filled3x3: Array2D[int]) -> None:
+        """Ensures append_column and resize mark only the cells that appeared or disappeared."""
+        filled3x3.track_dirty('cell')
+        filled3x3.append_column([0, 0, 0])
+        assert filled3x3.take_dirty() == {(0, 3), (1, 3), (2, 3)}
+        filled3x3.resize(4, 5)
+        assert filled3x3.take_dirty() == {(0, 4), (1, 4), (2, 4)} | {(3, col) for col in range(5)}
+        filled3x3.resize(2, 5)
+        assert filled3x3.take_dirty() == {(row, col) for row in (2, 3) for col in range(5)}
+        filled3x3.track_dirty('tile', tile=(2, 2))
+        filled3x3.resize(2, 3)
+        assert filled3x3.take_dirty() == {(0, 1), (0, 2)}
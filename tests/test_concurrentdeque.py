@@ -0,0 +1,104 @@
+import threading
+import time
+
+import pytest
+from datastructures.concurrentdeque import ConcurrentDeque
+
+class TestConcurrentDeque:
+    @pytest.fixture
+    def empty_deque(self) -> ConcurrentDeque[int]:
+        return ConcurrentDeque[int](data_type=int)
+
+    @pytest.fixture
+    def populated_deque(self) -> ConcurrentDeque[int]:
+        deque = ConcurrentDeque[int](data_type=int)
+        for i in range(5):
+            deque.enqueue(i)
+        return deque
+
+    def test_fifo(self, populated_deque: ConcurrentDeque[int]) -> None:
+        assert [populated_deque.dequeue() for _ in range(5)] == [0, 1, 2, 3, 4]
+        assert populated_deque.empty() is True
+
+    def test_front_back_len(self, populated_deque: ConcurrentDeque[int]) -> None:
+        assert populated_deque.front() == 0
+        assert populated_deque.back() == 4
+        assert len(populated_deque) == 5
+        assert 3 in populated_deque and 7 not in populated_deque
+        assert str(populated_deque) == "[0, 1, 2, 3, 4]"
+
+    def test_empty_errors(self, empty_deque: ConcurrentDeque[int]) -> None:
+        with pytest.raises(IndexError):
+            empty_deque.front()
+        with pytest.raises(IndexError):
+            empty_deque.back()
+        with pytest.raises(IndexError):
+            empty_deque.dequeue_back()
+        with pytest.raises(IndexError):
+            empty_deque.dequeue(timeout=0.01)
+        assert empty_deque.try_dequeue() is None
+        assert empty_deque.try_dequeue(default=-1) == -1
+
+    def test_type_check(self, empty_deque: ConcurrentDeque[int]) -> None:
+        with pytest.raises(TypeError):
+            empty_deque.enqueue("1")
+
+    def test_both_ends(self, populated_deque: ConcurrentDeque[int]) -> None:
+        populated_deque.enqueue_front(-1)
+        assert populated_deque.dequeue_back() == 4
+        assert populated_deque.dequeue_back() == 3
+        assert list(populated_deque) == [-1, 0, 1, 2]
+        populated_deque.enqueue(9)
+        assert populated_deque.back() == 9
+
+    def test_clear(self, populated_deque: ConcurrentDeque[int]) -> None:
+        populated_deque.clear()
+        assert len(populated_deque) == 0
+        assert populated_deque.try_dequeue() is None
+        populated_deque.enqueue(1)
+        assert populated_deque.dequeue(timeout=0) == 1
+
+    def test_eq(self, populated_deque: ConcurrentDeque[int]) -> None:
+        other = ConcurrentDeque[int](data_type=int)
+        for i in range(5):
+            other.enqueue(i)
+        assert populated_deque == other
+        other.dequeue()
+        assert populated_deque != other
+        assert populated_deque != [0, 1, 2, 3, 4]
+
+    def test_dequeue_blocks_until_enqueue(self, empty_deque: ConcurrentDeque[int]) -> None:
+        results = []
+        consumer = threading.Thread(target=lambda: results.append(empty_deque.dequeue(timeout=5)))
+        consumer.start()
+        time.sleep(0.05)
+        empty_deque.enqueue(42)
+        consumer.join()
+        assert results == [42]
+
+    def test_many_producers_and_consumers(self, empty_deque: ConcurrentDeque[int]) -> None:
+        producers, consumers, per_producer = 4, 4, 2000
+        taken: list[list[int]] = [[] for _ in range(consumers)]
+
+        def produce(start: int) -> None:
+            for i in range(start, start + per_producer):
+                empty_deque.enqueue(i)
+
+        def consume(out: list[int]) -> None:
+            for _ in range(producers * per_producer // consumers):
+                out.append(empty_deque.dequeue(timeout=10))
+
+        threads = [threading.Thread(target=produce, args=(p * per_producer,)) for p in range(producers)]
+        threads += [threading.Thread(target=consume, args=(out,)) for out in taken]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(item for out in taken for item in out) == list(range(producers * per_producer))
+        for out in taken:
+            # Each consumer sees every producer's items in the order they were enqueued
+            for p in range(producers):
+                mine = [item for item in out if item // per_producer == p]
+                assert mine == sorted(mine)
+        assert empty_deque.empty() is True
@@ -1,5 +1,7 @@
 import pytest
 from datastructures.deque import Deque
+from datastructures.singlylinkedlist import SinglyLinkedList
+from datastructures.unrolledlinkedlist import UnrolledLinkedList
 
 class TestDeque:
     @pytest.fixture
@@ -101,3 +103,51 @@ class TestDeque:
     def test_eq_non_deque(self, populated_deque: Deque[int]) -> None:
         assert populated_deque != [0, 1, 2, 3, 4]
 
+    def test_eq_across_list_types(self, populated_deque: Deque[int]) -> None:
+        for list_type in (SinglyLinkedList, UnrolledLinkedList):
+            other_deque = Deque[int](data_type=int, list_type=list_type)
+            for i in range(5):
+                other_deque.enqueue(i)
+            assert populated_deque == other_deque and other_deque == populated_deque
+            other_deque.dequeue_back()
+            assert populated_deque != other_deque
+
+
+    def test_unrolled_list_type(self) -> None:
+        deque = Deque[int](data_type=int, list_type=UnrolledLinkedList)
+        for i in range(200):
+            deque.enqueue(i)
+        deque.enqueue_front(-1)
+        assert deque.front() == -1
+        assert deque.dequeue_back() == 199
+        assert [deque.dequeue() for _ in range(200)] == list(range(-1, 199))
+        assert deque.empty() is True
+
+    def test_indexed_contains(self) -> None:
+        deque = Deque[int](data_type=int, indexed=True)
+        for item in [1, 2, 1]:
+            deque.enqueue(item)
+        assert 1 in deque and 3 not in deque
+        deque.dequeue()
+        deque.dequeue_back()
+        assert 1 not in deque and 2 in deque
+
+    def test_check_types_never(self) -> None:
+        deque = Deque[int](data_type=int, check_types='never')
+        deque.enqueue("a")
+        assert deque.dequeue() == "a"
+        with pytest.raises(TypeError):
+            Deque[int](data_type=int).enqueue("a")
+        for list_type in (SinglyLinkedList, UnrolledLinkedList):
+            deque = Deque[int](data_type=int, list_type=list_type, check_types='never')
+            deque.enqueue("a")
+            assert deque.dequeue() == "a"
+
+    def test_singly_linked_list_type(self) -> None:
+        deque = Deque[int](data_type=int, list_type=SinglyLinkedList)
+        for i in range(5):
+            deque.enqueue(i)
+        assert deque.back() == 4
+        assert deque.dequeue_back() == 4
+        assert [deque.dequeue() for _ in range(4)] == [0, 1, 2, 3]
+        assert deque.empty() is True
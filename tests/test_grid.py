@@ -0,0 +1,21 @@
+import random
+
+from projects.project2.grid import Grid
+
+class TestGrid:
+
+    def test_several_generations(self) -> None:
+        random.seed(5)
+        grid = Grid(12, 15)
+        for _ in range(5):
+            grid = grid.next_gen()
+            assert all(type(cell.is_alive) is bool for row in grid.grid for cell in row)
+
+    def test_next_gen_matches_get_neighbors(self) -> None:
+        random.seed(7)
+        grid = Grid(6, 8)
+        next_grid = grid.next_gen()
+        for row in range(grid.rows):
+            for col in range(grid.cols):
+                expected = grid.grid[row][col].next_state(grid.get_neighbors(row, col))
+                assert next_grid.grid[row][col].is_alive == expected
@@ -52,3 +52,114 @@ class TestHashMap:
         assert len(empty_hashmap) == 20
         for i in range(20):
             assert empty_hashmap[i] == str(i)
+
+    def test_hash_strategies(self):
+        for hashmap in (HashMap[str, int](), HashMap[str, int](hash_strategy='stable')):
+            for i in range(50):
+                hashmap[f"key{i}"] = i
+            assert all(hashmap[f"key{i}"] == i for i in range(50))
+        with pytest.raises(ValueError):
+            HashMap[str, int](hash_strategy='fast')
+
+    def test_stable_hash_is_deterministic(self):
+        assert HashMap._default_hash_function("key") == HashMap._default_hash_function("key")
+        assert HashMap(hash_strategy='stable').get_bucket_index("key", 11) == HashMap._default_hash_function("key") % 11
+
+    def test_unhashable_keys_fall_back(self, empty_hashmap: HashMap[int, str]):
+        empty_hashmap[[1, 2]] = "list"
+        assert empty_hashmap[[1, 2]] == "list"
+        assert [2, 1] not in empty_hashmap
+
+    def test_type_hashers(self):
+        calls = []
+        def hash_point(point: tuple) -> int:
+            calls.append(point)
+            return point[0] * 31 + point[1]
+        hashmap = HashMap[tuple, str](type_hashers={tuple: hash_point})
+        hashmap[(1, 2)] = "a"
+        hashmap["b"] = "b"
+        assert hashmap[(1, 2)] == "a" and hashmap["b"] == "b"
+        assert calls == [(1, 2), (1, 2)]
+
+    def test_resize_does_not_rehash(self):
+        calls = []
+        def counting_hash(key: int) -> int:
+            calls.append(key)
+            return key
+        hashmap = HashMap[int, str](custom_hash_function=counting_hash)
+        for i in range(100):
+            hashmap[i] = str(i)
+        assert len(calls) == 100
+        assert all(hashmap[i] == str(i) for i in range(100))
+
+    def test_colliding_hashes(self):
+        hashmap = HashMap[str, int](custom_hash_function=lambda key: 7)
+        for i in range(20):
+            hashmap[f"key{i}"] = i
+        hashmap["key3"] = 33
+        del hashmap["key4"]
+        assert hashmap["key3"] == 33 and "key4" not in hashmap
+        assert sorted(hashmap.values()) == sorted([i for i in range(20) if i not in (3, 4)] + [33])
+
+    def test_incremental_resize(self):
+        hashmap = HashMap[int, str](incremental_resize=True)
+        seen_rehashing = False
+        for i in range(500):
+            hashmap[i] = str(i)
+            seen_rehashing = seen_rehashing or hashmap.rehashing
+            if hashmap.rehashing:
+                # Keys still in the old table are found, updated and deleted correctly
+                assert all(hashmap[k] == str(k) for k in range(0, i + 1, 7))
+        assert seen_rehashing
+        hashmap[3] = "three"
+        del hashmap[4]
+        assert hashmap[3] == "three" and 4 not in hashmap
+        assert len(hashmap) == 499
+        assert sorted(hashmap.keys()) == [k for k in range(500) if k != 4]
+
+    def test_incremental_resize_finishes(self):
+        hashmap = HashMap[int, int](incremental_resize=True)
+        i = 0
+        while not hashmap.rehashing and i < 100:
+            hashmap[i] = i
+            i += 1
+        assert hashmap.rehashing  # a resize started
+        # Every write moves REHASH_BUCKETS_PER_STEP old buckets, so the old table is gone after a bounded number of writes
+        writes = -(-len(hashmap._old_buckets) // HashMap.REHASH_BUCKETS_PER_STEP)
+        assert all(hashmap[key] == key for key in range(i))  # lookups see both tables meanwhile
+        for key in range(i, i + writes):
+            hashmap[key] = key
+        assert not hashmap.rehashing
+        assert len(hashmap) == i + writes
+        assert all(hashmap[key] == key for key in range(i + writes))
+
+    def test_update_in_place(self, populated_hashmap: HashMap[int, str]):
+        _, _, node = populated_hashmap._locate(5)
+        populated_hashmap[5] = "five"
+        assert populated_hashmap._locate(5)[2] is node
+        assert node.data.value == "five"
+        assert len(populated_hashmap) == 10
+
+    def test_get(self, populated_hashmap: HashMap[int, str]):
+        assert populated_hashmap.get(3) == "3"
+        assert populated_hashmap.get(99) is None
+        assert populated_hashmap.get(99, "missing") == "missing"
+
+    def test_setdefault(self, populated_hashmap: HashMap[int, str]):
+        assert populated_hashmap.setdefault(3, "x") == "3"
+        assert populated_hashmap.setdefault(42, "x") == "x"
+        assert populated_hashmap[42] == "x" and len(populated_hashmap) == 11
+
+    def test_pop(self, populated_hashmap: HashMap[int, str]):
+        assert populated_hashmap.pop(3) == "3"
+        assert 3 not in populated_hashmap and len(populated_hashmap) == 9
+        assert populated_hashmap.pop(3, None) is None
+        with pytest.raises(KeyError):
+            populated_hashmap.pop(3)
+
+    def test_update_with(self, empty_hashmap: HashMap[str, int]):
+        for word in "the cat and the hat and the bat".split():
+            empty_hashmap.update_with(word, lambda count: count + 1, 0)
+        assert empty_hashmap["the"] == 3 and empty_hashmap["and"] == 2 and empty_hashmap["cat"] == 1
+        assert len(empty_hashmap) == 5
+        assert empty_hashmap.update_with("cat", lambda count: count * 10, 0) == 10
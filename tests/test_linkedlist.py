@@ -1,151 +1,300 @@
 import pytest
 
 from datastructures.ilinkedlist import ILinkedList
+from datastructures import linkedlist
 from datastructures.linkedlist import LinkedList
+from tests.ilinkedlist_suite import ILinkedListSuite, NewList
 
-class TestLinkedList:
+class TestLinkedList(ILinkedListSuite):
 
     @pytest.fixture
-    def empty(self) -> ILinkedList[int]:
-        return LinkedList[int](data_type=int)
-    
-    @pytest.fixture
-    def linked_list(self) -> ILinkedList[int]:
-        return LinkedList[int].from_sequence([0, 1, 2, 3, 4], data_type=int)
+    def new_list(self) -> NewList:
+        return lambda sequence, data_type=int: LinkedList.from_sequence(sequence, data_type=data_type)
 
-    def test_append(self, empty: ILinkedList[int]) -> None:
-        empty.append(1)
-        assert len(empty) == 1
-        assert empty.back == 1
+    def test_node_uses_slots(self, linked_list: LinkedList[int]) -> None:
+        assert not hasattr(linked_list.head, '__dict__')
+        with pytest.raises(AttributeError):
+            linked_list.head.extra = 1
+        # Nodes compare by identity, so two nodes holding the same value are different nodes
+        assert LinkedList.Node(data=1) != LinkedList.Node(data=1)
+
+    def test_node_handles(self, empty: LinkedList[int]) -> None:
+        first = empty.append(1)
+        last = empty.append(3)
+        middle = empty.insert_after_node(first, 2)
+        empty.insert_before_node(first, 0)
+        assert list(empty) == [0, 1, 2, 3]
+        assert empty.remove_node(middle) == 2
+        assert list(empty) == [0, 1, 3]
+        empty.move_to_front(last)
+        assert list(empty) == [3, 0, 1]
+        assert list(reversed(empty)) == [1, 0, 3]
+        empty.move_to_back(last)
+        assert list(empty) == [0, 1, 3]
+        assert len(empty) == 3
 
-    def test_append_not_empty(self, empty: ILinkedList[int]) -> None:
+    def test_node_handle_removed_twice(self, empty: LinkedList[int]) -> None:
         empty.append(1)
-        empty.append(2)
+        node = empty.append(2)
+        empty.append(3)
+        empty.remove_node(node)
+        with pytest.raises(ValueError):
+            empty.remove_node(node)
         assert len(empty) == 2
-        assert empty.back == 2
-
-    def test_prepend(self, empty: ILinkedList[int]) -> None:
-        empty.prepend(1)
-        assert len(empty) == 1
-        assert empty.front == 1
 
-    def test_insert_before(self, linked_list: ILinkedList[int]) -> None:
-        linked_list.insert_before(2, 99)
-        assert 99 in linked_list
-        assert list(linked_list) == [0, 1, 99, 2, 3, 4]
+    def test_nested_iteration(self, linked_list: ILinkedList[int]) -> None:
+        pairs = [(a, b) for a in linked_list for b in linked_list]
+        assert len(pairs) == 25
+        first, second = iter(linked_list), iter(linked_list)
+        assert next(first) == 0
+        assert next(second) == 0
+        assert next(first) == 1
 
-    def test_insert_before_not_found(self, linked_list: ILinkedList[int]) -> None:
-        with pytest.raises(ValueError):
-            linked_list.insert_before(10, 99)
+    def test_cursor_filter_in_place(self, linked_list: LinkedList[int]) -> None:
+        cursor = linked_list.cursor()
+        while cursor:
+            if cursor.value % 2:
+                cursor.remove()
+            else:
+                cursor.insert_after(cursor.value * 10)
+                cursor.advance()
+                cursor.advance()
+        assert list(linked_list) == [0, 0, 2, 20, 4, 40]
+        assert list(reversed(linked_list)) == [40, 4, 20, 2, 0, 0]
+        assert len(linked_list) == 6
+        with pytest.raises(IndexError):
+            cursor.advance()
 
-    def test_insert_after(self, linked_list: ILinkedList[int]) -> None:
-        linked_list.insert_after(2, 99)
-        assert 99 in linked_list
-        assert list(linked_list) == [0, 1, 2, 99, 3, 4]
+    def test_getitem_setitem(self, linked_list: LinkedList[int]) -> None:
+        assert [linked_list[i] for i in range(5)] == [0, 1, 2, 3, 4]
+        assert linked_list[-1] == 4
+        assert linked_list[3] == 3
+        linked_list[1] = 10
+        assert list(linked_list) == [0, 10, 2, 3, 4]
+        with pytest.raises(IndexError):
+            _ = linked_list[5]
+        with pytest.raises(TypeError):
+            linked_list[0] = "string"
 
-    def test_insert_after_not_found(self, linked_list: ILinkedList[int]) -> None:
-        with pytest.raises(ValueError):
-            linked_list.insert_after(10, 99)
+    def test_insert_at_delete_at(self, linked_list: LinkedList[int]) -> None:
+        linked_list.insert_at(2, 99)
+        linked_list.insert_at(0, -1)
+        linked_list.insert_at(len(linked_list), 100)
+        assert list(linked_list) == [-1, 0, 1, 99, 2, 3, 4, 100]
+        assert linked_list.delete_at(3) == 99
+        assert linked_list.delete_at(-1) == 100
+        assert list(linked_list) == [-1, 0, 1, 2, 3, 4]
+        assert [linked_list[i] for i in range(len(linked_list))] == [-1, 0, 1, 2, 3, 4]
+        with pytest.raises(IndexError):
+            linked_list.insert_at(10, 1)
 
-    def test_remove(self, linked_list: ILinkedList[int]) -> None:
+    def test_finger_survives_queue_operations(self, linked_list: LinkedList[int]) -> None:
+        assert linked_list[2] == 2
+        linked_list.prepend(-1)
+        linked_list.append(5)
+        assert linked_list[3] == 2
+        linked_list.pop_front()
+        linked_list.pop()
+        assert linked_list[2] == 2
         linked_list.remove(2)
-        assert 2 not in linked_list
-        assert list(linked_list) == [0, 1, 3, 4]
+        assert linked_list[2] == 3
 
-    def test_remove_not_found(self, linked_list: ILinkedList[int]) -> None:
-        with pytest.raises(ValueError):
-            linked_list.remove(10)
+    def test_slice(self, linked_list: LinkedList[int]) -> None:
+        assert list(linked_list.slice(1, 4)) == [1, 2, 3]
+        assert list(linked_list[-2:]) == [3, 4]
+        assert list(linked_list[::2]) == [0, 2, 4]
+        assert list(linked_list[3:1]) == []
 
-    def test_remove_all(self, linked_list: ILinkedList[int]) -> None:
-        linked_list.append(2)
-        linked_list.remove_all(2)
-        assert 2 not in linked_list
-        assert list(linked_list) == [0, 1, 3, 4]
+    def test_extend(self, linked_list: LinkedList[int]) -> None:
+        linked_list.extend(range(5, 8))
+        assert list(linked_list) == [0, 1, 2, 3, 4, 5, 6, 7]
+        with pytest.raises(TypeError):
+            linked_list.extend([8, "nine"])
+        assert len(linked_list) == 8  # Nothing was appended
 
-    def test_pop(self, linked_list: ILinkedList[int]) -> None:
-        assert linked_list.pop() == 4
-        assert len(linked_list) == 4
+    def test_splice(self, linked_list: LinkedList[int]) -> None:
+        other = LinkedList[int].from_sequence([10, 11], data_type=int)
+        linked_list.splice(other)
+        assert list(linked_list) == [0, 1, 2, 3, 4, 10, 11]
+        assert other.empty is True
+        middle = LinkedList[int].from_sequence([20, 21], data_type=int)
+        linked_list.splice(middle, after=linked_list.head)
+        assert list(linked_list) == [0, 20, 21, 1, 2, 3, 4, 10, 11]
+        assert list(reversed(linked_list)) == [11, 10, 4, 3, 2, 1, 21, 20, 0]
+        assert len(linked_list) == 9
+        with pytest.raises(TypeError):
+            linked_list.splice(LinkedList[str].from_sequence(["a"], data_type=str))
 
-    def test_pop_empty(self, empty: ILinkedList[int]) -> None:
-        with pytest.raises(IndexError):
-            empty.pop()
+    def test_concat(self) -> None:
+        parts = [LinkedList[int].from_sequence(range(i, i + 3), data_type=int) for i in (0, 3, 6)]
+        merged = LinkedList.concat(parts, data_type=int)
+        assert list(merged) == list(range(9))
+        assert len(merged) == 9
+        assert all(part.empty for part in parts)
 
-    def test_pop_front(self, linked_list: ILinkedList[int]) -> None:
-        assert linked_list.pop_front() == 0
-        assert len(linked_list) == 4
+    def test_split_at(self, linked_list: LinkedList[int]) -> None:
+        node = linked_list.head.next
+        rest = linked_list.split_at(node)
+        assert list(linked_list) == [0, 1]
+        assert list(rest) == [2, 3, 4]
+        assert len(linked_list) == 2 and len(rest) == 3
+        assert linked_list.back == 1 and rest.front == 2
+        assert list(linked_list.split_at(linked_list.tail)) == []
 
-    def test_pop_front_empty(self, empty: ILinkedList[int]) -> None:
-        with pytest.raises(IndexError):
-            empty.pop_front()
+    def test_sort(self, empty: LinkedList[int]) -> None:
+        items = [5, 3, 9, 1, 5, 7, 0, 2, 8, 3]
+        empty.extend(items)
+        empty.sort()
+        assert list(empty) == sorted(items)
+        assert list(reversed(empty)) == sorted(items, reverse=True)
+        empty.sort(reverse=True)
+        assert list(empty) == sorted(items, reverse=True)
+        assert empty.front == 9 and empty.back == 0
+        assert len(empty) == len(items)
 
-    def test_front(self, linked_list: ILinkedList[int]) -> None:
-        assert linked_list.front == 0
+    def test_sort_is_stable(self) -> None:
+        words = LinkedList[str].from_sequence(["pear", "fig", "apple", "kiwi", "plum", "date"], data_type=str)
+        words.sort(key=len)
+        assert list(words) == ["fig", "pear", "kiwi", "plum", "date", "apple"]
+        words.sort(key=len, reverse=True)
+        assert list(words) == ["apple", "pear", "kiwi", "plum", "date", "fig"]
 
-    def test_front_empty(self, empty: ILinkedList[int]) -> None:
-        with pytest.raises(IndexError):
-            _ = empty.front
+    def test_merge_sorted(self, linked_list: LinkedList[int]) -> None:
+        other = LinkedList[int].from_sequence([-1, 2, 2, 10], data_type=int)
+        linked_list.merge_sorted(other)
+        assert list(linked_list) == [-1, 0, 1, 2, 2, 2, 3, 4, 10]
+        assert list(reversed(linked_list)) == [10, 4, 3, 2, 2, 2, 1, 0, -1]
+        assert len(linked_list) == 9
+        assert other.empty is True
 
-    def test_back(self, linked_list: ILinkedList[int]) -> None:
-        assert linked_list.back == 4
+    def test_failed_sort_leaves_list_unchanged(self) -> None:
+        linked_list = LinkedList.from_sequence([9, 8, 7, 6, 5, 4, 3, 2, 'a', 1])
+        with pytest.raises(TypeError):
+            linked_list.sort()
+        assert list(linked_list) == [9, 8, 7, 6, 5, 4, 3, 2, 'a', 1]
+        assert list(reversed(linked_list)) == [1, 'a', 2, 3, 4, 5, 6, 7, 8, 9]
+        calls = []
+        def raising_key(item: int) -> int:
+            calls.append(item)
+            if item == 4:
+                raise ValueError("no key for 4")
+            return item
+        with pytest.raises(ValueError):
+            linked_list.sort(key=raising_key)
+        assert list(linked_list) == [9, 8, 7, 6, 5, 4, 3, 2, 'a', 1] and len(linked_list) == 10
+        linked_list.remove('a')
+        calls.clear()
+        linked_list.sort(key=lambda item: calls.append(item) or item)
+        assert list(linked_list) == [1, 2, 3, 4, 5, 6, 7, 8, 9]
+        assert len(calls) == 9  # one key call per item
 
-    def test_back_empty(self, empty: ILinkedList[int]) -> None:
-        with pytest.raises(IndexError):
-            _ = empty.back
+    def test_failed_merge_leaves_both_lists_unchanged(self) -> None:
+        mine = LinkedList.from_sequence([1, 3, 5])
+        other = LinkedList.from_sequence([2, 'x', 4])
+        with pytest.raises(TypeError):
+            mine.merge_sorted(other)
+        assert list(mine) == [1, 3, 5] and len(mine) == 3
+        assert list(other) == [2, 'x', 4] and len(other) == 3
 
-    def test_empty(self, empty: ILinkedList[int], linked_list: ILinkedList[int]) -> None:
-        assert empty.empty is True
-        assert linked_list.empty is False
+    def test_indexed_contains_and_remove(self) -> None:
+        linked_list = LinkedList[int].from_sequence([3, 1, 3, 2, 3], data_type=int, indexed=True)
+        assert linked_list.indexed is True
+        assert 2 in linked_list and 7 not in linked_list and [1] not in linked_list
+        linked_list.remove(3)
+        assert list(linked_list) == [1, 3, 2, 3]
+        linked_list.insert_after(3, 9)
+        assert list(linked_list) == [1, 3, 9, 2, 3]
+        linked_list.remove_all(3)
+        assert list(linked_list) == [1, 9, 2]
+        assert 3 not in linked_list
+        linked_list[0] = 5
+        assert 1 not in linked_list and 5 in linked_list
+        with pytest.raises(ValueError):
+            linked_list.remove(3)
 
-    def test_len(self, empty: ILinkedList[int], linked_list: ILinkedList[int]) -> None:
-        assert len(empty) == 0
-        assert len(linked_list) == 5
+    def test_indexed_rejects_unhashable_without_changes(self) -> None:
+        linked_list = LinkedList[list](data_type=list, indexed=True)
+        with pytest.raises(TypeError):
+            linked_list.append([1])
+        assert len(linked_list) == 0 and linked_list.empty is True
+        numbers = LinkedList[object].from_sequence([1, 2], data_type=object, indexed=True)
+        for edit in (lambda: numbers.prepend([3]), lambda: numbers.insert_at(1, [3]),
+                     lambda: numbers.extend([4, [5]]), lambda: numbers.__setitem__(0, [6]),
+                     lambda: numbers.splice(LinkedList[object].from_sequence([7, [8]], data_type=object))):
+            with pytest.raises(TypeError):
+                edit()
+            assert list(numbers) == [1, 2] and len(numbers) == 2
+        assert 1 in numbers
+        numbers.remove_all([1])  # unhashable, so absent: nothing to remove
+        assert list(numbers) == [1, 2]
+        assert numbers.pop() == 2 and numbers.pop() == 1
 
-    def test_clear(self, linked_list: ILinkedList[int]) -> None:
+    def test_indexed_follows_bulk_edits(self) -> None:
+        linked_list = LinkedList[int].from_sequence([4, 2, 6], data_type=int, indexed=True)
+        linked_list.splice(LinkedList[int].from_sequence([8, 1], data_type=int))
+        assert 8 in linked_list and 1 in linked_list
+        rest = linked_list.split_at(linked_list.head.next)
+        assert rest.indexed is True
+        assert 6 not in linked_list and 6 in rest and 8 in rest
+        linked_list.merge_sorted(LinkedList[int].from_sequence([3], data_type=int))
+        assert list(linked_list) == [3, 4, 2] and 3 in linked_list
+        cursor = linked_list.cursor()
+        cursor.value = 7
+        assert 3 not in linked_list and 7 in linked_list
         linked_list.clear()
-        assert len(linked_list) == 0
-        assert linked_list.empty is True
+        assert 7 not in linked_list
 
-    def test_contains(self, linked_list: ILinkedList[int]) -> None:
-        assert 2 in linked_list
-        assert 10 not in linked_list
+    def test_check_types_policy(self) -> None:
+        unchecked = LinkedList[int](data_type=int, check_types='never')
+        unchecked.append("1")
+        assert unchecked.front == "1"
+        debug = LinkedList[int](data_type=int, check_types='debug')
+        if __debug__:
+            with pytest.raises(TypeError):
+                debug.append("1")
+        with pytest.raises(ValueError):
+            LinkedList[int](data_type=int, check_types='sometimes')
 
-    def test_iter(self, linked_list: ILinkedList[int]) -> None:
-        assert list(iter(linked_list)) == [0, 1, 2, 3, 4]
+    def test_default_check_types(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(linkedlist, 'DEFAULT_CHECK_TYPES', 'never')
+        unchecked = LinkedList[int](data_type=int)
+        assert unchecked.check_types == 'never'
+        unchecked.prepend(1.5)
+        assert unchecked.split_at(unchecked.head).check_types == 'never'
+        assert LinkedList[int](data_type=int, check_types='always').check_types == 'always'
 
-    def test_eq(self, linked_list: ILinkedList[int]) -> None:
-        other = LinkedList[int].from_sequence([0, 1, 2, 3, 4], data_type=int)
-        assert linked_list == other
-        other.append(5)
-        assert linked_list != other
+    def test_reverse(self, linked_list: LinkedList[int]) -> None:
+        handle = linked_list.head.next
+        assert linked_list[3] == 3  # leaves the finger at index 3
+        linked_list.reverse()
+        assert list(linked_list) == [4, 3, 2, 1, 0]
+        assert list(reversed(linked_list)) == [0, 1, 2, 3, 4]
+        assert linked_list.front == 4 and linked_list.back == 0
+        assert linked_list[1] == 3 and linked_list[3] == 1
+        linked_list.remove_node(handle)
+        assert list(linked_list) == [4, 3, 2, 0]
+        linked_list.append(-1)
+        assert list(linked_list) == [4, 3, 2, 0, -1]
 
-    def test_reversed(self, linked_list: ILinkedList[int]) -> None:
-        reversed_list = list(reversed(linked_list))
-        assert reversed_list == [4, 3, 2, 1, 0]
+    def test_reversed_view(self, linked_list: LinkedList[int]) -> None:
+        view = linked_list.reversed_view()
+        assert list(view) == [4, 3, 2, 1, 0]
+        assert list(reversed(view)) == [0, 1, 2, 3, 4]
+        assert view.front == 4 and view.back == 0
+        assert view[0] == 4 and view[-1] == 0 and len(view) == 5
+        assert view != linked_list
+        assert view.reversed_view() == linked_list
+        view.append(-1)
+        assert linked_list.front == -1 and view.pop() == -1
+        assert view.pop_front() == 4 and linked_list.back == 3
+        palindrome = LinkedList[int].from_sequence([1, 2, 1], data_type=int)
+        assert palindrome == palindrome.reversed_view()
+        assert palindrome.reversed_view() == palindrome
 
-    def test_check_type_asserts(self, linked_list: ILinkedList[int]) -> None:
-        with pytest.raises(TypeError):
-            linked_list.append("string")
-        with pytest.raises(TypeError):
-            linked_list.prepend("string")
-        with pytest.raises(TypeError):
-            linked_list.insert_after(1, "string")
-        with pytest.raises(TypeError):
-            linked_list.insert_before(1, "string")
-        with pytest.raises(TypeError):
-            linked_list.insert_after("string", 2)
-        with pytest.raises(TypeError):
-            linked_list.insert_before("string", 2)
-        with pytest.raises(TypeError):
-            linked_list.remove("string")
-        with pytest.raises(TypeError):
-            linked_list.remove_all("string")
-        with pytest.raises(TypeError):
-            LinkedList.from_sequence([1, 2, 3], data_type=str)
 
-    def test_value_error_raised(self, linked_list: ILinkedList[int]) -> None:
-        with pytest.raises(ValueError):
-            linked_list.insert_before(10, 99)  # Target not in list
-        with pytest.raises(ValueError):
-            linked_list.insert_after(10, 99)  # Target not in list
-        with pytest.raises(ValueError):
-            linked_list.remove(10)  # Item not in list
\ No newline at end of file
+class TestIndexedLinkedList(TestLinkedList):
+    # Every LinkedList test again, on lists that keep a value index
+
+    @pytest.fixture
+    def new_list(self) -> NewList:
+        return lambda sequence, data_type=int: LinkedList.from_sequence(sequence, data_type=data_type, indexed=True)
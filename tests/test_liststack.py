@@ -1,5 +1,6 @@
 import pytest
 from datastructures.liststack import ListStack
+from datastructures.singlylinkedlist import SinglyLinkedList
 
 class TestListStack:
 
@@ -61,3 +62,27 @@ class TestListStack:
         assert len(empty_stack) == 0
         assert len(populated_stack) == 5
 
+    def test_check_types_policy(self) -> None:
+        stack = ListStack[int](data_type=int, check_types='never')
+        stack.push("a")
+        assert stack.pop() == "a"
+        with pytest.raises(TypeError):
+            ListStack[int](data_type=int, check_types='always').push("a")
+
+    def test_singly_linked_list_type(self) -> None:
+        stack = ListStack[int](data_type=int, list_type=SinglyLinkedList)
+        for i in range(5):
+            stack.push(i)
+        assert stack.peek() == 4
+        assert [stack.pop() for _ in range(5)] == [4, 3, 2, 1, 0]
+        assert stack.empty is True
+
+    def test_same_view_for_every_list_type(self, populated_stack: ListStack[int]) -> None:
+        singly = ListStack[int](data_type=int, list_type=SinglyLinkedList)
+        for i in range(5):
+            singly.push(i)
+        assert str(singly) == str(populated_stack) == "[0, 1, 2, 3, 4]"
+        assert singly == populated_stack and populated_stack == singly
+        singly.pop()
+        assert singly != populated_stack
+        assert populated_stack != [0, 1, 2, 3, 4]
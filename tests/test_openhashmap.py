@@ -0,0 +1,103 @@
+from datastructures.openhashmap import OpenHashMap
+import pytest
+
+class TestOpenHashMap:
+
+    @pytest.fixture
+    def empty_hashmap(self) -> OpenHashMap[int, str]:
+        return OpenHashMap[int, str]()
+
+    @pytest.fixture
+    def populated_hashmap(self) -> OpenHashMap[int, str]:
+        hashmap = OpenHashMap[int, str]()
+        for i in range(10):
+            hashmap[i] = str(i)
+        return hashmap
+
+    def test_set_and_get_item(self, empty_hashmap: OpenHashMap[int, str]):
+        empty_hashmap[1] = "one"
+        assert empty_hashmap[1] == "one"
+
+    def test_get_nonexistent_key(self, empty_hashmap: OpenHashMap[int, str]):
+        with pytest.raises(KeyError):
+            _ = empty_hashmap[99]
+
+    def test_update_existing_key(self, populated_hashmap: OpenHashMap[int, str]):
+        populated_hashmap[5] = "updated"
+        assert populated_hashmap[5] == "updated"
+        assert len(populated_hashmap) == 10
+
+    def test_delete_item(self, populated_hashmap: OpenHashMap[int, str]):
+        del populated_hashmap[5]
+        assert 5 not in populated_hashmap
+        assert len(populated_hashmap) == 9
+
+    def test_delete_nonexistent_key(self, empty_hashmap: OpenHashMap[int, str]):
+        with pytest.raises(KeyError):
+            del empty_hashmap[99]
+
+    def test_contains_key(self, populated_hashmap: OpenHashMap[int, str]):
+        assert 5 in populated_hashmap
+        assert 99 not in populated_hashmap
+
+    def test_iteration(self, populated_hashmap: OpenHashMap[int, str]):
+        assert sorted(populated_hashmap) == list(range(10))
+        assert sorted(populated_hashmap.values(), key=int) == [str(i) for i in range(10)]
+        assert sorted(populated_hashmap.items()) == [(i, str(i)) for i in range(10)]
+
+    def test_resize(self, empty_hashmap: OpenHashMap[int, str]):
+        for i in range(1000):
+            empty_hashmap[i] = str(i)
+        assert len(empty_hashmap) == 1000
+        assert empty_hashmap.capacity * empty_hashmap._load_factor >= 1000
+        assert all(empty_hashmap[i] == str(i) for i in range(1000))
+
+    def test_probe_past_tombstones(self):
+        # Every key has the same hash, so they all share one probe sequence
+        hashmap = OpenHashMap[str, int](custom_hash_function=lambda key: 3)
+        for i in range(5):
+            hashmap[f"key{i}"] = i
+        del hashmap["key1"]
+        assert hashmap["key4"] == 4 and "key1" not in hashmap
+        hashmap["key5"] = 5  # reuses the tombstone
+        assert hashmap["key5"] == 5 and len(hashmap) == 5
+        hashmap["key4"] = 44
+        assert hashmap["key4"] == 44 and len(hashmap) == 5
+
+    def test_compaction(self, empty_hashmap: OpenHashMap[int, str]):
+        for round_ in range(50):
+            for i in range(10):
+                empty_hashmap[round_ * 10 + i] = str(i)
+            for i in range(10):
+                del empty_hashmap[round_ * 10 + i]
+        assert len(empty_hashmap) == 0
+        assert empty_hashmap._deleted <= empty_hashmap.capacity // 4
+        assert empty_hashmap.capacity <= 64
+
+    def test_compaction_does_not_rehash(self):
+        calls = []
+        def counting_hash(key: int) -> int:
+            calls.append(key)
+            return key
+        hashmap = OpenHashMap[int, int](custom_hash_function=counting_hash)
+        for i in range(100):
+            hashmap[i] = i
+        assert len(calls) == 100
+
+    def test_eq(self, populated_hashmap: OpenHashMap[int, str]):
+        other = OpenHashMap[int, str](initial_capacity=64)
+        for i in reversed(range(10)):
+            other[i] = str(i)
+        assert populated_hashmap == other
+        other[3] = "three"
+        assert populated_hashmap != other
+        assert populated_hashmap != {i: str(i) for i in range(10)}
+
+    def test_mixed_keys(self, empty_hashmap: OpenHashMap):
+        empty_hashmap["a"] = 1
+        empty_hashmap[(1, 2)] = 2
+        empty_hashmap[[1, 2]] = 3
+        empty_hashmap[None] = 4
+        assert empty_hashmap["a"] == 1 and empty_hashmap[(1, 2)] == 2
+        assert empty_hashmap[[1, 2]] == 3 and empty_hashmap[None] == 4
+        assert empty_hashmap.get("missing", 0) == 0
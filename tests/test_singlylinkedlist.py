@@ -0,0 +1,30 @@
+import pytest
+
+from datastructures.singlylinkedlist import SinglyLinkedList
+from tests.ilinkedlist_suite import ILinkedListSuite, NewList
+
+class TestSinglyLinkedList(ILinkedListSuite):
+
+    @pytest.fixture
+    def new_list(self) -> NewList:
+        return lambda sequence, data_type=int: SinglyLinkedList.from_sequence(sequence, data_type=data_type)
+
+    def test_tail_follows_edits(self, linked_list: SinglyLinkedList[int]) -> None:
+        linked_list.insert_after(4, 5)
+        assert linked_list.back == 5
+        assert linked_list.pop() == 5 and linked_list.pop() == 4
+        linked_list.remove_all(3)
+        assert linked_list.back == 2
+        linked_list.append(6)
+        assert list(linked_list) == [0, 1, 2, 6]
+        linked_list.insert_before(0, -1)
+        assert linked_list.front == -1
+        while not linked_list.empty:
+            linked_list.pop_front()
+        assert linked_list.head is None and linked_list.tail is None
+        linked_list.append(7)
+        assert linked_list.front == linked_list.back == 7
+
+    def test_nodes_have_no_previous(self, linked_list: SinglyLinkedList[int]) -> None:
+        assert not hasattr(linked_list.head, 'previous')
+        assert not hasattr(linked_list.head, '__dict__')
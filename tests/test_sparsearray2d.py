@@ -0,0 +1,63 @@
+import pytest
+from datastructures.array2d import Array2D
+from datastructures.sparsearray2d import SparseArray2D
+
+class TestSparseArray2D:
+
+    # ✅ Fixtures to create test instances of SparseArray2D
+    @pytest.fixture
+    def empty1000x1000(self) -> SparseArray2D[int]:
+        """Returns an empty 1000x1000 SparseArray2D with int type."""
+        return SparseArray2D.empty(rows=1000, cols=1000, data_type=int)
+
+    @pytest.fixture
+    def filled3x3(self) -> SparseArray2D[int]:
+        """Returns a mostly-zero 3x3 SparseArray2D."""
+        return SparseArray2D([[0, 0, 3], [0, 5, 0], [0, 0, 0]], data_type=int)
+
+    # ✅ Test only non-default cells are stored
+    def test_init_stores_non_default_cells(self, filled3x3: SparseArray2D[int]) -> None:
+        """Checks that only the two non-zero cells are kept while every cell still reads correctly."""
+        assert filled3x3.nnz == 2
+        assert [list(row) for row in filled3x3] == [[0, 0, 3], [0, 5, 0], [0, 0, 0]]
+
+    # ✅ Test Getting and Setting Items on a large empty array
+    def test_set_get_item(self, empty1000x1000: SparseArray2D[int]) -> None:
+        """Ensures values can be set and read back, and writing the default frees the cell."""
+        assert empty1000x1000[999][999] == 0
+        empty1000x1000[500][250] = 42
+        assert empty1000x1000[500][250] == 42
+        assert empty1000x1000.nnz == 1
+        empty1000x1000[500][250] = 0
+        assert empty1000x1000.nnz == 0
+
+    # ✅ Test Out of Bounds Indexing and type checks
+    def test_out_of_bounds_and_type(self, filled3x3: SparseArray2D[int]) -> None:
+        """Ensures bad indices raise IndexError and bad values raise TypeError."""
+        with pytest.raises(IndexError):
+            _ = filled3x3[3][0]
+        with pytest.raises(IndexError):
+            _ = filled3x3[0][3]
+        with pytest.raises(TypeError):
+            filled3x3[0][0] = "string"
+
+    # ✅ Test iterating over stored cells
+    def test_nonzero_items(self, filled3x3: SparseArray2D[int]) -> None:
+        """Verifies nonzero_items yields exactly the stored cells with their coordinates."""
+        assert sorted(filled3x3.nonzero_items()) == [((0, 2), 3), ((1, 1), 5)]
+
+    # ✅ Test conversion to and from a dense Array2D
+    def test_dense_round_trip(self, filled3x3: SparseArray2D[int]) -> None:
+        """Checks that to_dense and from_dense preserve every cell."""
+        dense = filled3x3.to_dense()
+        assert dense == Array2D([[0, 0, 3], [0, 5, 0], [0, 0, 0]], data_type=int)
+        assert SparseArray2D.from_dense(dense) == filled3x3
+        assert SparseArray2D.from_dense(Array2D([["", "x"]], data_type=str)).nnz == 1
+
+    # ✅ Test Length, String Representation and Reverse Iteration
+    def test_len_str_reversed(self, filled3x3: SparseArray2D[int]) -> None:
+        """Ensures the sequence protocol matches Array2D."""
+        assert len(filled3x3) == 3
+        assert str(filled3x3) == "[[0, 0, 3], [0, 5, 0], [0, 0, 0]]"
+        assert repr(filled3x3).startswith("SparseArray2D 3 Rows x 3 Columns")
+        assert [list(row) for row in reversed(filled3x3)][0] == [0, 0, 0]
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+from datastructures.array2d import Array2D
+from datastructures.tiledarray2d import TiledArray2D
+
+class TestTiledArray2D:
+
+    # ✅ Fixtures to create test instances of TiledArray2D
+    @pytest.fixture
+    def counting5x7(self) -> TiledArray2D[int]:
+        """Returns a 5x7 TiledArray2D holding 0..34 in 2x3 tiles, so the edges are partial tiles."""
+        return TiledArray2D([[row * 7 + col for col in range(7)] for row in range(5)], data_type=int, tile=(2, 3))
+
+    # ✅ Test Getting and Setting Items across tiles
+    def test_set_get_item(self, counting5x7: TiledArray2D[int]) -> None:
+        """Checks every cell maps to the right tile and that writes land in place."""
+        assert [list(row) for row in counting5x7] == [[row * 7 + col for col in range(7)] for row in range(5)]
+        counting5x7[4][6] = -1
+        assert counting5x7[4][6] == -1
+
+    # ✅ Test region reads spanning several tiles
+    def test_read_write_region(self, counting5x7: TiledArray2D[int]) -> None:
+        """Ensures read_region and write_region stitch tiles together correctly."""
+        expected = np.arange(35).reshape(5, 7)
+        assert np.array_equal(counting5x7.read_region(1, 4, 2, 6), expected[1:4, 2:6])
+        counting5x7.write_region(1, 2, np.zeros((3, 4), dtype=int))
+        expected[1:4, 2:6] = 0
+        assert np.array_equal(counting5x7.to_numpy(), expected)
+
+    # ✅ Test Out of Bounds Indexing
+    def test_out_of_bounds(self, counting5x7: TiledArray2D[int]) -> None:
+        """Ensures cells and regions outside the grid raise IndexError, even inside the padding tiles."""
+        with pytest.raises(IndexError):
+            _ = counting5x7[5][0]
+        with pytest.raises(IndexError):
+            _ = counting5x7[0][7]
+        with pytest.raises(IndexError):
+            counting5x7.read_region(0, 6, 0, 1)
+
+    # ✅ Test a tiled file opened through Array2D.open_mmap
+    def test_open_mmap_tiled(self, tmp_path) -> None:
+        """Checks that a tiled memory-mapped grid keeps its contents across reopening."""
+        path = tmp_path / "tiled.bin"
+        grid = Array2D.open_mmap(path, rows=10, cols=10, dtype=float, tile=(4, 4))
+        assert isinstance(grid, TiledArray2D)
+        grid[9][9] = 2.5
+        grid.flush()
+        del grid
+
+        reopened = TiledArray2D.open(path, rows=10, cols=10, dtype=float, tile=(4, 4))
+        assert reopened[9][9] == 2.5
+        assert repr(reopened).startswith("TiledArray2D 10 Rows x 10 Columns")
+
+    # ✅ Test reopening a tiled file with another layout of the same size
+    def test_open_other_layout(self, tmp_path) -> None:
+        """Ensures a file is not silently read with a tile shape or size it was not written with."""
+        path = tmp_path / "tiled.bin"
+        TiledArray2D.open(path, rows=10, cols=10, dtype=float, tile=(4, 4)).flush()
+        with pytest.raises(ValueError):
+            TiledArray2D.open(path, rows=10, cols=10, dtype=float, tile=(6, 6))  # Pads to the same 144 cells
+        with pytest.raises(ValueError):
+            TiledArray2D.open(path, rows=9, cols=10, dtype=float, tile=(4, 4))
+        assert TiledArray2D.open(path, rows=10, cols=10, dtype=float, tile=(4, 4), mode='r')[0][0] == 0
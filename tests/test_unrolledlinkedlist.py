@@ -0,0 +1,60 @@
+import pytest
+
+from datastructures.unrolledlinkedlist import UnrolledLinkedList
+from tests.ilinkedlist_suite import ILinkedListSuite, NewList
+
+class TestUnrolledLinkedList(ILinkedListSuite):
+
+    @pytest.fixture
+    def new_list(self) -> NewList:
+        # capacity=2 makes the shared tests cross node boundaries and split nodes
+        return lambda sequence, data_type=int: UnrolledLinkedList.from_sequence(sequence, data_type=data_type, capacity=2)
+
+    def test_node_split(self, linked_list: UnrolledLinkedList[int]) -> None:
+        for item in (10, 11, 12):
+            linked_list.insert_after(2, item)
+        assert list(linked_list) == [0, 1, 2, 12, 11, 10, 3, 4]
+        assert list(reversed(linked_list)) == [4, 3, 10, 11, 12, 2, 1, 0]
+        assert all(len(node_items) <= 2 for node_items in self._node_items(linked_list))
+        linked_list.remove_all(12)
+        linked_list.remove(11)
+        linked_list.remove(10)
+        assert list(linked_list) == [0, 1, 2, 3, 4]
+        assert len(linked_list) == 5
+
+    def test_fifo(self, empty: UnrolledLinkedList[int]) -> None:
+        for item in range(100):
+            empty.append(item)
+        assert [empty.pop_front() for _ in range(100)] == list(range(100))
+        assert empty.empty is True
+        assert empty.head is None and empty.tail is None
+
+    def test_nodes_stay_half_full(self) -> None:
+        linked_list = UnrolledLinkedList.from_sequence(range(400), capacity=8)
+        for item in range(0, 400, 4):
+            linked_list.insert_after(item, -item)
+        for item in range(400):
+            if item % 5:
+                linked_list.remove(item)
+        linked_list.remove_all(0)
+        expected = [item for item in range(400) if item % 5 == 0 and item] + [-item for item in range(4, 400, 4)]
+        assert sorted(linked_list) == sorted(expected)
+        node_sizes = [len(items) for items in self._node_items(linked_list)]
+        assert all(size >= 4 for size in node_sizes[1:-1])
+        assert len(node_sizes) <= 2 * len(linked_list) // 8 + 2
+
+    def test_both_ends(self, empty: UnrolledLinkedList[int]) -> None:
+        for item in range(50):
+            empty.prepend(item)
+            empty.append(item)
+        assert [empty.pop_front() for _ in range(50)] == list(range(49, -1, -1))
+        assert [empty.pop() for _ in range(50)] == list(range(49, -1, -1))
+        assert empty.head is None and empty.tail is None
+
+    @staticmethod
+    def _node_items(linked_list: UnrolledLinkedList[int]) -> list:
+        items, current = [], linked_list.head
+        while current:
+            items.append(current.items)
+            current = current.next
+        return items